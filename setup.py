@@ -5,19 +5,64 @@ Automates the setup and deployment of n8n on AWS EKS using Terraform and Helm
 """
 
 import os
+import re
 import sys
 import json
+import base64
 import subprocess
 import shutil
+import shlex
 import tempfile
 import secrets
+import string
 import argparse
 import time
+import functools
 from pathlib import Path
-from typing import Optional, Dict, Any, Tuple
+from typing import Optional, Dict, Any, List, Tuple
 import signal
+import select
+import threading
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 
+# boto3 and the Azure SDK are optional and imported on first use (see
+# _aws_client and _kv_client): together they add a noticeable fraction of a
+# second to startup, which --help, GCP and most wizard paths never need.
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # Optional: faster parsing of terraform state and CLI JSON output
+    _json_loads = json.loads
+
+try:
+    import ijson
+except ImportError:  # Optional: stream large terraform state files instead of loading them whole
+    ijson = None
+
+try:
+    import bcrypt
+except ImportError:  # Optional: falls back to the htpasswd binary for basic auth
+    bcrypt = None
+
+# Matches `htpasswd -B` default cost so hashes stay identical in strength
+_BCRYPT_ROUNDS = 5
+# Resolved once; None when apache2-utils/httpd-tools is not installed
+_HTPASSWD = shutil.which('htpasswd')
+
+_TFVARS_BASIC_AUTH_RE = re.compile(r'enable_basic_auth\s*=\s*(?:true|false)')
+# `key = "value"` string assignments in terraform.tfvars, one match per line
+_TFVARS_RE = re.compile(r'^\s*(\w+)\s*=\s*"([^"]*)"', re.MULTILINE)
+
+# EKS cluster ARN (arn:PARTITION:eks:REGION:ACCOUNT:cluster/NAME), any partition
+_EKS_ARN_RE = re.compile(r'arn:aws[a-z-]*:eks:([a-z0-9-]+):')
+
+# Section separator used throughout the console output
+_SEP = "=" * 60
+
 # ANSI color codes
 class Colors:
     HEADER = '\033[94m'    # Light Blue for headers
@@ -491,7 +536,6 @@ class DependencyChecker:
         """
         missing = []
         outdated = []
-        import re
 
         provider_names = {
             "aws": "AWS EKS",
@@ -611,14 +655,12 @@ class CertificateValidator:
     @staticmethod
     def validate_email(email: str) -> bool:
         """Simple email validation"""
-        import re
         pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
         return re.match(pattern, email) is not None
 
     @classmethod
     def validate_certificate_chain(cls, cert_content: str, key_content: str, domain: str) -> Tuple[bool, str]:
         """Validate certificate against private key, expiration, and domain"""
-        import tempfile
         import datetime
 
         try:
@@ -657,7 +699,6 @@ class CertificateValidator:
             ).stdout
             
             # Check Subject Alternative Name (SAN)
-            import re
             san_match = re.search(r'X509v3 Subject Alternative Name: \n\s*DNS:([^,]+)', cert_text)
             sans = []
             if san_match:
@@ -692,6 +733,16 @@ class AWSAuthChecker:
     @staticmethod
     def get_available_profiles() -> list:
         """Get list of configured AWS profiles"""
+        return list(AWSAuthChecker._list_profiles())
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _list_profiles() -> Tuple[str, ...]:
+        """Run `aws configure list-profiles` once per process
+
+        Profiles don't change while the wizard runs, and each AWS CLI start
+        costs the better part of a second.
+        """
         try:
             result = subprocess.run(
                 ['aws', 'configure', 'list-profiles'],
@@ -700,10 +751,10 @@ class AWSAuthChecker:
                 timeout=10
             )
             if result.returncode == 0:
-                return [p.strip() for p in result.stdout.strip().split('\n') if p.strip()]
-            return []
+                return tuple(p.strip() for p in result.stdout.strip().split('\n') if p.strip())
+            return ()
         except Exception:
-            return []
+            return ()
 
     @staticmethod
     def verify_credentials(profile: Optional[str] = None, region: Optional[str] = None) -> Tuple[bool, str]:
@@ -726,7 +777,7 @@ class AWSAuthChecker:
             )
 
             if result.returncode == 0:
-                identity = json.loads(result.stdout)
+                identity = _json_loads(result.stdout)
                 account_id = identity.get('Account', 'unknown')
                 user_arn = identity.get('Arn', 'unknown')
                 return True, f"Account: {account_id}, User: {user_arn}"
@@ -751,7 +802,7 @@ class GCPAuthChecker:
                 timeout=30
             )
             if result.returncode == 0:
-                projects = json.loads(result.stdout)
+                projects = _json_loads(result.stdout)
                 return [{'projectId': p['projectId'], 'name': p.get('name', p['projectId'])}
                         for p in projects]
             return []
@@ -782,7 +833,7 @@ class GCPAuthChecker:
             if auth_result.returncode != 0:
                 return False, "Not authenticated with gcloud. Run: gcloud auth login"
 
-            auth_accounts = json.loads(auth_result.stdout)
+            auth_accounts = _json_loads(auth_result.stdout)
             active_accounts = [a for a in auth_accounts if a.get('status') == 'ACTIVE']
 
             if not active_accounts:
@@ -799,7 +850,7 @@ class GCPAuthChecker:
             )
 
             if project_result.returncode == 0:
-                project_info = json.loads(project_result.stdout)
+                project_info = _json_loads(project_result.stdout)
                 project_name = project_info.get('name', project_id)
                 return True, f"Authenticated as {active_email}, Project: {project_name}"
             else:
@@ -847,7 +898,7 @@ class GCPAuthChecker:
             if result.returncode != 0:
                 return False, required_apis
 
-            enabled_services = json.loads(result.stdout)
+            enabled_services = _json_loads(result.stdout)
             enabled_api_names = {svc.get('config', {}).get('name', '') for svc in enabled_services}
 
             missing = [api for api in required_apis if api not in enabled_api_names]
@@ -957,7 +1008,7 @@ class ConfigurationPrompt:
             skip_tls: If True, skip TLS configuration (TLS will be configured after LoadBalancer is ready)
         """
         print(f"\n{Colors.HEADER}{Colors.BOLD}N8N EKS Deployment Configuration{Colors.ENDC}")
-        print("=" * 60)
+        print(_SEP)
 
         # AWS Configuration
         print(f"\n{Colors.BOLD}AWS Configuration{Colors.ENDC}")
@@ -1149,7 +1200,7 @@ class ConfigurationPrompt:
     def _show_summary(self):
         """Display configuration summary"""
         print(f"\n{Colors.HEADER}{Colors.BOLD}Configuration Summary{Colors.ENDC}")
-        print("=" * 60)
+        print(_SEP)
         print(f"Deployment:      {Colors.OKCYAN}AWS EKS (Kubernetes){Colors.ENDC}")
         print(f"AWS Profile:     {Colors.OKCYAN}{self.config.aws_profile}{Colors.ENDC}")
         print(f"AWS Region:      {Colors.OKCYAN}{self.config.aws_region}{Colors.ENDC}")
@@ -1166,7 +1217,7 @@ class ConfigurationPrompt:
             print(f"  RDS Instance:  {Colors.OKCYAN}{self.config.rds_instance_class}{Colors.ENDC}")
             print(f"  RDS Storage:   {Colors.OKCYAN}{self.config.rds_allocated_storage}GB{Colors.ENDC}")
             print(f"  RDS Multi-AZ:  {Colors.OKCYAN}{'Yes' if self.config.rds_multi_az else 'No'}{Colors.ENDC}")
-        print("=" * 60)
+        print(_SEP)
         print(f"\n{Colors.WARNING}Note: TLS and Basic Auth will be configured after deployment{Colors.ENDC}")
 
     def collect_azure_configuration(self, skip_tls: bool = True) -> AzureDeploymentConfig:
@@ -1176,7 +1227,7 @@ class ConfigurationPrompt:
             skip_tls: If True, skip TLS configuration (TLS will be configured after LoadBalancer is ready)
         """
         print(f"\n{Colors.HEADER}{Colors.BOLD}N8N Azure AKS Deployment Configuration{Colors.ENDC}")
-        print("=" * 60)
+        print(_SEP)
 
         # Azure Configuration
         print(f"\n{Colors.BOLD}Azure Configuration{Colors.ENDC}")
@@ -1421,7 +1472,7 @@ class ConfigurationPrompt:
 
         # Show configuration summary
         print(f"\n{Colors.HEADER}{Colors.BOLD}Configuration Summary{Colors.ENDC}")
-        print("=" * 60)
+        print(_SEP)
         print(f"Subscription:    {Colors.OKCYAN}{self.config.azure_subscription_id}{Colors.ENDC}")
         print(f"Location:        {Colors.OKCYAN}{self.config.azure_location}{Colors.ENDC}")
         print(f"Resource Group:  {Colors.OKCYAN}{self.config.resource_group_name}{Colors.ENDC}")
@@ -1442,7 +1493,7 @@ class ConfigurationPrompt:
             print(f"  PostgreSQL SKU: {Colors.OKCYAN}{self.config.postgres_sku}{Colors.ENDC}")
             print(f"  Storage:        {Colors.OKCYAN}{self.config.postgres_storage_gb}GB{Colors.ENDC}")
             print(f"  High Avail:     {Colors.OKCYAN}{'Yes' if self.config.postgres_high_availability else 'No'}{Colors.ENDC}")
-        print("=" * 60)
+        print(_SEP)
         print(f"\n{Colors.WARNING}Note: TLS and Basic Auth will be configured after deployment{Colors.ENDC}")
 
         return self.config
@@ -1454,7 +1505,7 @@ class ConfigurationPrompt:
             skip_tls: If True, skip TLS configuration (TLS will be configured after LoadBalancer is ready)
         """
         print(f"\n{Colors.HEADER}{Colors.BOLD}N8N GCP GKE Deployment Configuration{Colors.ENDC}")
-        print("=" * 60)
+        print(_SEP)
 
         # GCP Configuration
         print(f"\n{Colors.BOLD}GCP Configuration{Colors.ENDC}")
@@ -1716,7 +1767,7 @@ class ConfigurationPrompt:
 
         # Show configuration summary
         print(f"\n{Colors.HEADER}{Colors.BOLD}Configuration Summary{Colors.ENDC}")
-        print("=" * 60)
+        print(_SEP)
         print(f"Project ID:      {Colors.OKCYAN}{self.config.gcp_project_id}{Colors.ENDC}")
         print(f"Region:          {Colors.OKCYAN}{self.config.gcp_region}{Colors.ENDC}")
         print(f"Zone:            {Colors.OKCYAN}{self.config.gcp_zone}{Colors.ENDC}")
@@ -1734,7 +1785,7 @@ class ConfigurationPrompt:
         if self.config.database_type == "cloudsql":
             print(f"  Instance Name: {Colors.OKCYAN}{self.config.cloudsql_instance_name}{Colors.ENDC}")
             print(f"  Tier:          {Colors.OKCYAN}{self.config.cloudsql_tier}{Colors.ENDC}")
-        print("=" * 60)
+        print(_SEP)
 
         if skip_tls:
             print(f"\n{Colors.WARNING}Note: TLS and Basic Auth will be configured after deployment{Colors.ENDC}")
@@ -2002,8 +2053,6 @@ class FileUpdater:
     @staticmethod
     def _update_variable_default(content: str, var_name: str, value: str) -> str:
         """Update a Terraform variable default value"""
-        import re
-
         # Match variable block and update default
         pattern = rf'(variable\s+"{var_name}"\s+\{{[^}}]*default\s*=\s*)"[^"]*"'
         replacement = rf'\1"{value}"'
@@ -2013,8 +2062,6 @@ class FileUpdater:
     @staticmethod
     def _replace_yaml_value(content: str, key: str, value: str, in_section: str = None) -> str:
         """Replace a YAML value"""
-        import re
-
         # Escape special regex characters in key
         escaped_key = re.escape(key)
 
@@ -2144,6 +2191,105 @@ def load_existing_configuration(script_dir: Path, cloud_provider: str = "aws"):
     return config
 
 
+def _arn_region(arn: str) -> Optional[str]:
+    """Return the region of an EKS cluster ARN, or None for anything else."""
+    match = _EKS_ARN_RE.match(arn)
+    return match.group(1) if match else None
+
+
+def _find_eks_region(state_data: Dict) -> Optional[str]:
+    """Return the region of the first EKS cluster found in terraform state data."""
+    for resource in state_data.get('resources', []):
+        if resource.get('type') != 'aws_eks_cluster':
+            continue
+        instances = resource.get('instances', [])
+        if not instances:
+            continue
+        arn = instances[0].get('attributes', {}).get('arn', '')
+        if arn:
+            return _arn_region(arn)
+    return None
+
+
+def _safe_stat(path: Path) -> Optional[os.stat_result]:
+    """stat() a path, returning None if it doesn't exist (or can't be stat'ed)
+
+    One syscall answers both "does it exist" and the size/mtime that the state
+    caches key on, instead of an exists() check followed by a stat().
+    """
+    try:
+        return path.stat()
+    except OSError:
+        return None
+
+
+def _scan_tfstate(tfstate_path: Path, stat: Optional[os.stat_result] = None) -> Tuple[bool, Optional[str]]:
+    """Return (has resources, EKS cluster region) for a terraform.tfstate file
+
+    The answer is cached per file revision, so the pre-apply region check and
+    the backup that follows it read the state once.
+
+    Args:
+        tfstate_path: State file to scan
+        stat: The file's stat result, if the caller already has it
+    """
+    if stat is None:
+        stat = tfstate_path.stat()
+    return _scan_tfstate_revision(str(tfstate_path.resolve()), stat.st_mtime_ns, stat.st_size)
+
+
+@functools.lru_cache(maxsize=8)
+def _scan_tfstate_revision(tfstate_path: str, mtime_ns: int, size: int) -> Tuple[bool, Optional[str]]:
+    """Scan one revision of a state file; mtime_ns and size only key the cache
+
+    With ijson installed the state is streamed and the scan stops at the
+    first EKS cluster, instead of loading the whole file into memory.
+    """
+    with open(tfstate_path, 'rb') as f:
+        if ijson is None:
+            state_data = _json_loads(f.read())
+            return bool(state_data.get('resources')), _find_eks_region(state_data)
+
+        has_resources = False
+        for resource in ijson.items(f, 'resources.item'):
+            has_resources = True
+            if resource.get('type') != 'aws_eks_cluster' or not resource.get('instances'):
+                continue
+            arn = resource['instances'][0].get('attributes', {}).get('arn', '')
+            if arn:
+                return True, _arn_region(arn)
+        return has_resources, None
+
+
+def _region_from_tfstate(tfstate_path: Path) -> Optional[str]:
+    """Return the EKS cluster region recorded in a terraform.tfstate file
+
+    The state is plain JSON, so reading it directly avoids starting terraform
+    just to print one output.
+    """
+    try:
+        return _scan_tfstate(tfstate_path)[1]
+    except Exception:
+        return None
+
+
+def _region_from_kube_context() -> Optional[str]:
+    """Return the region of the current kubectl context if it is an EKS cluster ARN"""
+    try:
+        result = subprocess.run(
+            ['kubectl', 'config', 'current-context'],
+            capture_output=True,
+            text=True,
+            timeout=5
+        )
+        # EKS contexts are cluster ARNs; _arn_region rejects any other context
+        if result.returncode == 0:
+            return _arn_region(result.stdout.strip())
+    except Exception:
+        pass
+    return None
+
+
 def save_state_for_region(terraform_dir: Path, region: str) -> bool:
     """
     Save current terraform state file with region/location-specific naming.
@@ -2158,24 +2304,27 @@ def save_state_for_region(terraform_dir: Path, region: str) -> bool:
     tfstate_path = terraform_dir / "terraform.tfstate"
 
     # Check if state file exists and has resources
-    if not tfstate_path.exists():
+    stat = _safe_stat(tfstate_path)
+    if stat is None:
         print(f"{Colors.WARNING}⚠  No terraform state file found, nothing to save{Colors.ENDC}")
         return False
 
     # Check if state has resources (not empty state)
     try:
-        with open(tfstate_path, 'r') as f:
-            state_data = json.load(f)
-            if not state_data.get('resources'):
-                print(f"{Colors.WARNING}⚠  Terraform state is empty (no resources), skipping backup{Colors.ENDC}")
-                return False
-    except (json.JSONDecodeError, Exception) as e:
+        has_resources, _ = _scan_tfstate(tfstate_path, stat)
+        if not has_resources:
+            print(f"{Colors.WARNING}⚠  Terraform state is empty (no resources), skipping backup{Colors.ENDC}")
+            return False
+    except Exception as e:
         print(f"{Colors.WARNING}⚠  Could not read state file: {e}{Colors.ENDC}")
         return False
 
     # Create region-specific backup
     backup_path = terraform_dir / f"terraform.tfstate.{region}.backup"
 
+    # A real copy, not a hardlink: Terraform's local backend truncates and
+    # rewrites terraform.tfstate in place, which would change a linked backup too.
+    # (copy2 already uses the kernel's sendfile fast path on Linux.)
     try:
         shutil.copy2(tfstate_path, backup_path)
         print(f"{Colors.OKGREEN}✓ Saved state for region {region} to {backup_path.name}{Colors.ENDC}")
@@ -2208,8 +2357,8 @@ def restore_state_for_region(terraform_dir: Path, region: str) -> bool:
     # Backup current state before overwriting (if it exists and has resources)
     if tfstate_path.exists():
         try:
-            with open(tfstate_path, 'r') as f:
-                state_data = json.load(f)
+            with open(tfstate_path, 'rb') as f:
+                state_data = _json_loads(f.read())
                 if state_data.get('resources'):
                     # Save current state with timestamp
                     timestamp = int(time.time())
@@ -2226,8 +2375,8 @@ def restore_state_for_region(terraform_dir: Path, region: str) -> bool:
 
         # Show what was restored
         try:
-            with open(tfstate_path, 'r') as f:
-                state_data = json.load(f)
+            with open(tfstate_path, 'rb') as f:
+                state_data = _json_loads(f.read())
                 resource_count = len(state_data.get('resources', []))
                 print(f"{Colors.OKCYAN}  State contains {resource_count} resources{Colors.ENDC}")
         except Exception:
@@ -2257,22 +2406,13 @@ def list_available_state_backups(terraform_dir: Path):
         if parts and not parts.isdigit():
             # Try to read the backup to get info
             try:
-                with open(backup, 'r') as f:
-                    state_data = json.load(f)
+                with open(backup, 'rb') as f:
+                    state_data = _json_loads(f.read())
                     resource_count = len(state_data.get('resources', []))
                     file_size = backup.stat().st_size
 
                     # Try to find EKS cluster ARN for confirmation
-                    region_from_arn = None
-                    for resource in state_data.get('resources', []):
-                        if resource.get('type') == 'aws_eks_cluster':
-                            instances = resource.get('instances', [])
-                            if instances:
-                                arn = instances[0].get('attributes', {}).get('arn', '')
-                                if arn:
-                                    # ARN format: arn:aws:eks:REGION:...
-                                    region_from_arn = arn.split(':')[3] if len(arn.split(':')) > 3 else None
-                                    break
+                    region_from_arn = _find_eks_region(state_data)
 
                     region_display = f"{parts}"
                     if region_from_arn and region_from_arn != parts:
@@ -2283,15 +2423,53 @@ def list_available_state_backups(terraform_dir: Path):
                 print(f"  • {parts}: (unable to read)")
 
 
+@functools.lru_cache(maxsize=None)
+def _terraform_env() -> Dict[str, str]:
+    """Return the environment terraform runs with
+
+    Points TF_PLUGIN_CACHE_DIR at a per-user cache so `terraform init` reuses
+    downloaded providers across runs, regions and the aws/azure/gcp stacks.
+    A cache directory the user already configured is left alone.
+    """
+    env = dict(os.environ)
+    if not env.get('TF_PLUGIN_CACHE_DIR'):
+        cache_dir = Path.home() / ".cache" / "n8n-setup" / "tf-plugins"
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            env['TF_PLUGIN_CACHE_DIR'] = str(cache_dir)
+        except OSError:
+            pass
+    return env
+
+
+def _print_unrefreshed_plan_notice():
+    """Warn that a plan run with refresh=False may not match what apply does"""
+    print(f"{Colors.WARNING}⚠  This plan was not refreshed against live infrastructure, so it does not "
+          f"show drift; apply re-plans with a refresh before changing anything{Colors.ENDC}")
+
+
 class TerraformRunner:
     """Handles Terraform execution"""
 
+    _CMD = ('terraform',)
+
+    # `terraform output -json` results keyed by (directory, tfstate mtime), shared
+    # by every runner so repeated lookups in one run don't respawn terraform.
+    # Any apply/destroy rewrites the state file, which changes the key.
+    _outputs_cache: Dict[Tuple[str, int], Dict[str, str]] = {}
+
     def __init__(self, terraform_dir: Path):
         self.terraform_dir = terraform_dir
 
-    def run_command(self, args: list, interactive: bool = False) -> Tuple[bool, str]:
-        """Run a terraform command"""
-        cmd = ['terraform'] + args
+    def run_command(self, args: list, interactive: bool = False, timeout: int = 300) -> Tuple[bool, str]:
+        """Run a terraform command
+
+        Args:
+            args: Arguments passed to terraform
+            interactive: Inherit the terminal instead of capturing output
+            timeout: Seconds to wait for non-interactive commands
+        """
+        cmd = (*self._CMD, *args)
 
         try:
             if interactive:
@@ -2299,16 +2477,21 @@ class TerraformRunner:
                 result = subprocess.run(
                     cmd,
                     cwd=self.terraform_dir,
+                    env=_terraform_env(),
                     text=True
                 )
                 return result.returncode == 0, ""
             else:
+                # Own session: a Ctrl+C aimed at the wizard is not delivered
+                # straight to terraform (run() still kills it on interrupt)
                 result = subprocess.run(
                     cmd,
                     cwd=self.terraform_dir,
+                    env=_terraform_env(),
                     capture_output=True,
                     text=True,
-                    timeout=300
+                    timeout=timeout,
+                    start_new_session=True
                 )
                 return result.returncode == 0, result.stdout + result.stderr
         except subprocess.TimeoutExpired:
@@ -2329,34 +2512,52 @@ class TerraformRunner:
 
         return success
 
-    def plan(self, display_output: bool = True) -> Tuple[bool, str]:
+    def plan(self, display_output: bool = True, lock: bool = True, refresh: bool = True,
+             parallelism: int = 20) -> Tuple[bool, str]:
         """Run Terraform plan and optionally display output
 
+        Args:
+            display_output: Print the plan output on success
+            lock: Acquire the state lock. Preview-only plans can skip it since
+                the following `terraform apply` takes the lock and re-plans.
+            refresh: Refresh remote state first. Skipping it makes the plan much
+                faster on large states, at the cost of a possibly stale preview.
+            parallelism: Concurrent provider operations (terraform's default is 10)
+
         Returns:
             Tuple of (success, output_text)
         """
         print(f"\n{Colors.HEADER}📋 Running Terraform plan...{Colors.ENDC}")
-        success, output = self.run_command(['plan', '-no-color'])
+        args = ['plan', '-no-color', f'-parallelism={parallelism}']
+        if not lock:
+            args.append('-lock=false')
+        if not refresh:
+            args.append('-refresh=false')
+        success, output = self.run_command(args)
 
         if success:
             print(f"{Colors.OKGREEN}✓ Terraform plan completed{Colors.ENDC}")
             if display_output:
                 print(f"\n{Colors.BOLD}Plan Summary:{Colors.ENDC}")
-                print("=" * 60)
+                print(_SEP)
                 print(output)
-                print("=" * 60)
+                print(_SEP)
         else:
             print(f"{Colors.FAIL}✗ Terraform plan failed{Colors.ENDC}")
             print(output)
 
         return success, output
 
-    def apply(self) -> bool:
-        """Apply Terraform configuration"""
+    def apply(self, parallelism: int = 20) -> bool:
+        """Apply Terraform configuration
+
+        Args:
+            parallelism: Concurrent provider operations (terraform's default is 10)
+        """
         print(f"\n{Colors.HEADER}🚀 Applying Terraform configuration...{Colors.ENDC}")
         print(f"{Colors.WARNING}This will create real AWS resources and may incur costs.{Colors.ENDC}")
 
-        success, _ = self.run_command(['apply'], interactive=True)
+        success, _ = self.run_command(['apply', f'-parallelism={parallelism}'], interactive=True)
 
         if success:
             print(f"\n{Colors.OKGREEN}✓ Terraform apply completed{Colors.ENDC}")
@@ -2366,15 +2567,24 @@ class TerraformRunner:
         return success
 
     def get_outputs(self) -> Dict[str, str]:
-        """Get Terraform outputs"""
+        """Get Terraform outputs, reusing them while the local state is unchanged"""
+        stat = _safe_stat(self.terraform_dir / "terraform.tfstate")
+        # No local state (e.g. remote backend): always ask terraform
+        key = (str(self.terraform_dir.resolve()), stat.st_mtime_ns) if stat is not None else None
+        if key in self._outputs_cache:
+            return dict(self._outputs_cache[key])
+
         success, output = self.run_command(['output', '-json'])
 
         if success:
             try:
-                outputs = json.loads(output)
-                return {k: v.get('value', '') for k, v in outputs.items()}
+                outputs = _json_loads(output)
+                outputs = {k: v.get('value', '') for k, v in outputs.items()}
             except json.JSONDecodeError:
                 return {}
+            if key is not None:
+                self._outputs_cache[key] = outputs
+            return dict(outputs)
 
         return {}
 
@@ -2392,15 +2602,58 @@ class TerraformRunner:
 
         return success
 
+def _run_silent(cmd: list, timeout: int = 30) -> subprocess.CompletedProcess:
+    """Run a command whose output is not needed, only its return code"""
+    return subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=timeout)
+
+
+def _apply_secret(name: str, namespace: str, data: Dict[str, str],
+                  secret_type: str = 'Opaque') -> subprocess.CompletedProcess:
+    """Create or update a Kubernetes secret with one server-side apply
+
+    Apply is idempotent, so an existing secret is updated in place instead of
+    being deleted and recreated.
+
+    Args:
+        name: Secret name
+        namespace: Namespace of the secret
+        data: Secret keys mapped to plain-text values
+        secret_type: Kubernetes secret type (e.g. kubernetes.io/tls)
+    """
+    manifest = {
+        'apiVersion': 'v1',
+        'kind': 'Secret',
+        'metadata': {'name': name, 'namespace': namespace},
+        'type': secret_type,
+        'data': {key: base64.b64encode(value.encode('utf-8')).decode('ascii')
+                 for key, value in data.items()},
+    }
+    return subprocess.run(
+        ['kubectl', 'apply', '--server-side', '--force-conflicts', '-f', '-'],
+        input=json.dumps(manifest),
+        capture_output=True,
+        text=True,
+        timeout=30
+    )
+
+
 class HelmRunner:
     """Handles Helm execution"""
 
+    _CMD = ('helm',)
+
     def __init__(self, helm_dir: Path):
         self.helm_dir = helm_dir
 
-    def run_command(self, args: list, interactive: bool = False) -> Tuple[bool, str]:
-        """Run a helm command"""
-        cmd = ['helm'] + args
+    def run_command(self, args: list, interactive: bool = False, timeout: int = 300) -> Tuple[bool, str]:
+        """Run a helm command
+
+        Args:
+            args: Arguments passed to helm
+            interactive: Inherit the terminal instead of capturing output
+            timeout: Seconds to wait for non-interactive commands
+        """
+        cmd = (*self._CMD, *args)
 
         try:
             if interactive:
@@ -2411,7 +2664,8 @@ class HelmRunner:
                     cmd,
                     capture_output=True,
                     text=True,
-                    timeout=300
+                    timeout=timeout,
+                    start_new_session=True
                 )
                 return result.returncode == 0, result.stdout + result.stderr
         except subprocess.TimeoutExpired:
@@ -2419,6 +2673,25 @@ class HelmRunner:
         except Exception as e:
             return False, str(e)
 
+    @staticmethod
+    def _ensure_namespace(namespace: str) -> Tuple[bool, str]:
+        """Create the namespace if it does not exist
+
+        Returns:
+            Tuple of (created, error_output); error_output is empty on success
+        """
+        namespace_check = _run_silent(['kubectl', 'get', 'namespace', namespace])
+        if namespace_check.returncode == 0:
+            return False, ""
+
+        result = subprocess.run(
+            ['kubectl', 'create', 'namespace', namespace],
+            capture_output=True, text=True
+        )
+        if result.returncode != 0:
+            return False, result.stderr or "kubectl create namespace failed"
+        return True, ""
+
     def deploy_n8n(self, config: DeploymentConfig, encryption_key: str, namespace: str = "n8n",
                     tls_enabled: bool = False, db_config: Dict[str, Any] = None) -> bool:
         """Deploy n8n via Helm without TLS initially
@@ -2458,38 +2731,21 @@ class HelmRunner:
 
             # Create Kubernetes Secret for database credentials
             try:
-                # Ensure namespace exists before creating secret
-                namespace_check = subprocess.run(
-                    ['kubectl', 'get', 'namespace', namespace],
-                    capture_output=True
-                )
-                if namespace_check.returncode != 0:
-                    # Create namespace if it doesn't exist
-                    result = subprocess.run(
-                        ['kubectl', 'create', 'namespace', namespace],
-                        capture_output=True, text=True
-                    )
-                    if result.returncode != 0:
-                        print(f"{Colors.FAIL}✗ Failed to create namespace {namespace}{Colors.ENDC}")
-                        print(result.stderr)
-                        return False
+                # Sequential on purpose: _apply_secret upserts, so there is no
+                # stale-secret delete left to overlap with the namespace step
+                created, error = self._ensure_namespace(namespace)
+                if error:
+                    print(f"{Colors.FAIL}✗ Failed to create namespace {namespace}{Colors.ENDC}")
+                    print(error)
+                    return False
+                if created:
                     print(f"{Colors.OKGREEN}  ✓ Created namespace {namespace}{Colors.ENDC}")
 
-                # Check if secret already exists and delete it
-                subprocess.run(
-                    ['kubectl', 'delete', 'secret', 'n8n-db-credentials', '-n', namespace],
-                    capture_output=True
-                )
-
                 # Create new secret with database credentials
                 # Get password based on database type
                 db_password = db_config.get("cloudsql_password") if db_type == 'cloudsql' else db_config.get("rds_password", "")
 
-                result = subprocess.run([
-                    'kubectl', 'create', 'secret', 'generic', 'n8n-db-credentials',
-                    '-n', namespace,
-                    f'--from-literal=password={db_password}'
-                ], capture_output=True, text=True)
+                result = _apply_secret('n8n-db-credentials', namespace, {'password': db_password})
 
                 if result.returncode != 0:
                     print(f"{Colors.FAIL}✗ Failed to create database credentials secret{Colors.ENDC}")
@@ -2530,7 +2786,7 @@ class HelmRunner:
                 '--set', 'database.type=sqlite',
             ])
 
-        success, output = self.run_command(values_args)
+        success, output = self.run_command(values_args, timeout=600)
 
         if success:
             print(f"{Colors.OKGREEN}✓ n8n deployed successfully{Colors.ENDC}")
@@ -2591,7 +2847,7 @@ class HelmRunner:
                 '--set', f'ingress.annotations.cert-manager\\.io/cluster-issuer={cert_manager_annotation}'
             ])
 
-        success, output = self.run_command(values_args)
+        success, output = self.run_command(values_args, timeout=300)
 
         if success:
             print(f"{Colors.OKGREEN}✓ n8n upgraded with TLS{Colors.ENDC}")
@@ -2604,17 +2860,16 @@ class HelmRunner:
 def verify_n8n_deployment(namespace: str, timeout_seconds: int = 300) -> bool:
     """Verify that the n8n deployment is ready"""
     print(f"\n{Colors.HEADER}⏳ Waiting for n8n deployment to be ready...{Colors.ENDC}")
-    import time
 
     start_time = time.time()
     while time.time() - start_time < timeout_seconds:
         try:
             result = subprocess.run(
                 ['kubectl', 'get', 'deployment', 'n8n', '-n', namespace, '-o', 'json'],
-                capture_output=True, text=True, timeout=10
+                capture_output=True, timeout=10
             )
             if result.returncode == 0:
-                status = json.loads(result.stdout).get('status', {})
+                status = _json_loads(result.stdout).get('status', {})
                 replicas = status.get('replicas', 0)
                 ready_replicas = status.get('readyReplicas', 0)
 
@@ -2634,58 +2889,99 @@ def verify_n8n_deployment(namespace: str, timeout_seconds: int = 300) -> bool:
     print(f"{Colors.FAIL}✗ Timed out waiting for n8n deployment to become ready.{Colors.ENDC}")
     return False
 
-def get_loadbalancer_url(max_attempts: int = 30, delay: int = 10) -> Optional[str]:
-    """Get the LoadBalancer URL from NGINX ingress controller
+def _configure_kubectl(outputs: Dict[str, Any]) -> bool:
+    """Run the configure_kubectl command from Terraform outputs, if present
 
-    Args:
-        max_attempts: Maximum number of attempts to get the URL
-        delay: Delay in seconds between attempts
+    Returns False only when the command exists and fails; the command is
+    printed so the user can run it by hand.
+    """
+    kubectl_cmd = outputs.get('configure_kubectl')
+    if not kubectl_cmd:
+        return True
+
+    print(f"\n{Colors.HEADER}🔧 Configuring kubectl...{Colors.ENDC}")
+    result = subprocess.run(shlex.split(kubectl_cmd), capture_output=True, text=True)
+
+    if result.returncode == 0:
+        print(f"{Colors.OKGREEN}✓ kubectl configured{Colors.ENDC}")
+        return True
+
+    print(f"{Colors.WARNING}⚠  kubectl configuration failed. Run manually:{Colors.ENDC}")
+    print(f"  {Colors.OKCYAN}{kubectl_cmd}{Colors.ENDC}")
+    return False
+
+
+def _watch_lb_address(timeout: float) -> Optional[str]:
+    """Watch the ingress-nginx Service until it has a load balancer address
+
+    kubectl prints the Service once and then again on every change, so the
+    address is seen as soon as the cloud provider assigns it. `kubectl wait
+    --for=jsonpath=...` can't be used instead: it only waits for one field,
+    while AWS sets a hostname and Azure/GCP an IP, and testing a field for mere
+    presence needs kubectl 1.31+.
 
     Returns:
-        LoadBalancer DNS name or IP address, or None if not found
+        LoadBalancer DNS name or IP address, or None if the watch ended first
     """
-    print(f"\n{Colors.HEADER}⏳ Waiting for LoadBalancer to be ready...{Colors.ENDC}")
+    try:
+        process = subprocess.Popen(
+            ['kubectl', 'get', 'svc', '-n', 'ingress-nginx', 'ingress-nginx-controller', '--watch',
+             '-o', 'jsonpath={.status.loadBalancer.ingress[0].hostname} {.status.loadBalancer.ingress[0].ip}{"\\n"}'],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            start_new_session=True
+        )
+    except OSError:
+        return None
 
-    for attempt in range(1, max_attempts + 1):
+    def stop():
+        # Kill the whole group so no credential plugin child keeps the pipe open
         try:
-            # Try hostname first (AWS ELB)
-            result_hostname = subprocess.run(
-                ['kubectl', 'get', 'svc', '-n', 'ingress-nginx', 'ingress-nginx-controller',
-                 '-o', 'jsonpath={.status.loadBalancer.ingress[0].hostname}'],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
+            os.killpg(process.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
 
-            if result_hostname.returncode == 0 and result_hostname.stdout.strip():
-                lb_url = result_hostname.stdout.strip()
-                print(f"{Colors.OKGREEN}✓ LoadBalancer ready: {lb_url}{Colors.ENDC}")
-                return lb_url
+    timer = threading.Timer(timeout, stop)
+    timer.start()
+    try:
+        for line in process.stdout:
+            # Hostname first (AWS ELB), then IP address (Azure, GCP)
+            address = line.split()
+            if address:
+                return address[0]
+    finally:
+        timer.cancel()
+        stop()
+        process.wait()
+    return None
 
-            # Try IP address (Azure, GCP)
-            result_ip = subprocess.run(
-                ['kubectl', 'get', 'svc', '-n', 'ingress-nginx', 'ingress-nginx-controller',
-                 '-o', 'jsonpath={.status.loadBalancer.ingress[0].ip}'],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
 
-            if result_ip.returncode == 0 and result_ip.stdout.strip():
-                lb_url = result_ip.stdout.strip()
-                print(f"{Colors.OKGREEN}✓ LoadBalancer ready: {lb_url}{Colors.ENDC}")
-                return lb_url
+def get_loadbalancer_url(max_attempts: int = 30, delay: int = 10) -> Optional[str]:
+    """Get the LoadBalancer URL from NGINX ingress controller
 
-            print(f"  Attempt {attempt}/{max_attempts} - LoadBalancer not ready yet...")
-            if attempt < max_attempts:
-                import time
-                time.sleep(delay)
+    Args:
+        max_attempts: Together with delay, bounds the total wait
+        delay: Seconds before re-watching if the watch ends early (e.g. the
+            Service doesn't exist yet)
 
-        except Exception as e:
-            print(f"{Colors.WARNING}Error checking LoadBalancer: {e}{Colors.ENDC}")
-            if attempt < max_attempts:
-                import time
-                time.sleep(delay)
+    Returns:
+        LoadBalancer DNS name or IP address, or None if not found
+    """
+    print(f"\n{Colors.HEADER}⏳ Waiting for LoadBalancer to be ready...{Colors.ENDC}")
+
+    deadline = time.time() + max_attempts * delay
+    while True:
+        lb_url = _watch_lb_address(deadline - time.time())
+        if lb_url:
+            print(f"{Colors.OKGREEN}✓ LoadBalancer ready: {lb_url}{Colors.ENDC}")
+            return lb_url
+
+        remaining = deadline - time.time()
+        if remaining <= 0:
+            break
+        print("  LoadBalancer not ready yet...")
+        time.sleep(min(delay, remaining))
 
     print(f"{Colors.FAIL}✗ LoadBalancer not ready after {max_attempts * delay} seconds{Colors.ENDC}")
     return None
@@ -2703,7 +2999,7 @@ def configure_tls_interactive(config: DeploymentConfig, script_dir: Path, loadba
         True if TLS was configured successfully
     """
     print(f"\n{Colors.HEADER}{Colors.BOLD}TLS/HTTPS Configuration{Colors.ENDC}")
-    print("=" * 60)
+    print(_SEP)
     print("Your n8n is currently accessible via HTTP (unencrypted)")
     print(f"LoadBalancer URL: {Colors.OKCYAN}{loadbalancer_url}{Colors.ENDC}")
     print()
@@ -2781,26 +3077,10 @@ def configure_tls_interactive(config: DeploymentConfig, script_dir: Path, loadba
         # Create TLS secret
         print(f"\n{Colors.HEADER}Creating TLS secret...{Colors.ENDC}")
         try:
-            # Create temporary files for cert and key
-            import tempfile
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.crt', delete=False) as cert_file:
-                cert_file.write(config.tls_certificate_crt)
-                cert_path = cert_file.name
-
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.key', delete=False) as key_file:
-                key_file.write(config.tls_certificate_key)
-                key_path = key_file.name
-
-            result = subprocess.run([
-                'kubectl', 'create', 'secret', 'tls', 'n8n-tls',
-                '-n', namespace,
-                f'--cert={cert_path}',
-                f'--key={key_path}'
-            ], capture_output=True, text=True)
-
-            # Clean up temp files
-            os.unlink(cert_path)
-            os.unlink(key_path)
+            result = _apply_secret('n8n-tls', namespace, {
+                'tls.crt': config.tls_certificate_crt,
+                'tls.key': config.tls_certificate_key,
+            }, secret_type='kubernetes.io/tls')
 
             if result.returncode == 0:
                 print(f"{Colors.OKGREEN}✓ TLS secret created{Colors.ENDC}")
@@ -2838,7 +3118,7 @@ def configure_tls_interactive(config: DeploymentConfig, script_dir: Path, loadba
 
         # Show DNS configuration instructions
         print(f"\n{Colors.WARNING}{Colors.BOLD}⚠️  IMPORTANT - DNS Configuration Required{Colors.ENDC}")
-        print("=" * 60)
+        print(_SEP)
         print(f"Before proceeding, you MUST configure DNS:")
         print(f"\n1. Create a DNS record for: {Colors.OKCYAN}{config.n8n_host}{Colors.ENDC}")
         print(f"2. Point it to LoadBalancer: {Colors.OKCYAN}{loadbalancer_url}{Colors.ENDC}")
@@ -2846,7 +3126,7 @@ def configure_tls_interactive(config: DeploymentConfig, script_dir: Path, loadba
         print(f"   Name: {Colors.OKCYAN}{config.n8n_host}{Colors.ENDC}")
         print(f"   Value: {Colors.OKCYAN}{loadbalancer_url}{Colors.ENDC}")
         print(f"\n   OR use an {Colors.BOLD}A record (ALIAS){Colors.ENDC} if your DNS provider supports it")
-        print("=" * 60)
+        print(_SEP)
 
         if not prompt.prompt_yes_no("\nHave you configured the DNS record?", default=False):
             print(f"\n{Colors.WARNING}TLS configuration cancelled{Colors.ENDC}")
@@ -2856,15 +3136,12 @@ def configure_tls_interactive(config: DeploymentConfig, script_dir: Path, loadba
         # Install cert-manager (check if already installed)
         print(f"\n{Colors.HEADER}Installing cert-manager...{Colors.ENDC}")
         try:
-            # Check if cert-manager is already installed
+            # Check if cert-manager is already installed (its CRDs are registered)
             check_result = subprocess.run([
-                'helm', 'list', '-n', 'cert-manager', '-o', 'json'
-            ], capture_output=True, text=True, timeout=30)
+                'kubectl', 'get', 'crd', 'certificates.cert-manager.io', '-o', 'name'
+            ], capture_output=True, text=True, timeout=10)
 
-            cert_manager_installed = False
-            if check_result.returncode == 0:
-                releases = json.loads(check_result.stdout)
-                cert_manager_installed = any(r.get('name') == 'cert-manager' for r in releases)
+            cert_manager_installed = check_result.returncode == 0 and check_result.stdout.strip() != ''
 
             if cert_manager_installed:
                 print(f"{Colors.OKGREEN}✓ cert-manager already installed{Colors.ENDC}")
@@ -2875,7 +3152,7 @@ def configure_tls_interactive(config: DeploymentConfig, script_dir: Path, loadba
                     '--namespace', 'cert-manager',
                     '--create-namespace',
                     '--set', 'installCRDs=true'
-                ], capture_output=True, text=True, timeout=180)
+                ], capture_output=True, text=True, timeout=600)
 
                 if result.returncode == 0:
                     print(f"{Colors.OKGREEN}✓ cert-manager installed{Colors.ENDC}")
@@ -2942,16 +3219,16 @@ spec:
         print(f"\n{Colors.OKGREEN}{Colors.BOLD}✅ TLS Configuration Complete!{Colors.ENDC}")
 
         if config.tls_certificate_source == "letsencrypt":
-            print("\n" + "=" * 60)
+            print("\n" + _SEP)
             print(f"{Colors.BOLD}Let's Encrypt Certificate Issuance{Colors.ENDC}")
-            print("=" * 60)
+            print(_SEP)
             print("Certificate issuance typically takes 2-5 minutes")
             print("\nMonitor certificate status:")
             print(f"  {Colors.OKCYAN}kubectl get certificate -n {namespace}{Colors.ENDC}")
             print(f"  {Colors.OKCYAN}kubectl describe certificate n8n-tls -n {namespace}{Colors.ENDC}")
             print("\nOnce ready, access n8n at:")
             print(f"  {Colors.OKGREEN}https://{config.n8n_host}{Colors.ENDC}")
-            print("=" * 60)
+            print(_SEP)
         else:
             print(f"\nAccess n8n at: {Colors.OKGREEN}https://{config.n8n_host}{Colors.ENDC}")
 
@@ -2960,6 +3237,77 @@ spec:
         print(f"\n{Colors.FAIL}TLS configuration failed{Colors.ENDC}")
         return False
 
+@functools.lru_cache(maxsize=None)
+def _aws_config():
+    """Return the botocore Config shared by every boto3 client
+
+    Pooled keep-alive connections and adaptive retries. None when boto3 is not
+    installed (the AWS CLI is used instead). botocore alone is not enough: the
+    pip-installed AWS CLI v1 brings it in without boto3.
+    """
+    try:
+        import boto3  # noqa: F401 - imported by _aws_session
+        from botocore.config import Config
+    except ImportError:
+        return None
+    return Config(
+        max_pool_connections=32,
+        retries={'max_attempts': 8, 'mode': 'adaptive'},
+        tcp_keepalive=True
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _aws_session(profile: Optional[str], region: str):
+    """Return a boto3 Session cached per (profile, region)"""
+    import boto3
+    return boto3.Session(profile_name=profile or None, region_name=region)
+
+
+@functools.lru_cache(maxsize=None)
+def _aws_client(service: str, profile: Optional[str], region: str):
+    """Return a boto3 client cached per (service, profile, region)
+
+    All clients for a profile/region share one boto3 Session, so credentials
+    are resolved once and HTTPS connections are reused across calls.
+
+    Returns:
+        boto3 client, or None when boto3 is not installed
+    """
+    config = _aws_config()
+    if config is None:
+        return None
+    session = _aws_session(profile, region)
+    return session.client(service, config=config)
+
+
+@functools.lru_cache(maxsize=None)
+def _azure_credential():
+    """Return one DefaultAzureCredential for the whole process
+
+    Access tokens are cached on the credential instance, so sharing it means
+    the credential chain is walked and a token fetched only once per scope.
+    """
+    from azure.identity import DefaultAzureCredential
+    return DefaultAzureCredential()
+
+
+@functools.lru_cache(maxsize=None)
+def _kv_client(subscription_id: str):
+    """Return a Key Vault management client cached per subscription
+
+    Returns:
+        KeyVaultManagementClient, or None when the Azure SDK is not installed
+        (the az CLI is used instead)
+    """
+    try:
+        from azure.mgmt.keyvault import KeyVaultManagementClient
+        credential = _azure_credential()
+    except ImportError:
+        return None
+    return KeyVaultManagementClient(credential, subscription_id)
+
+
 def configure_basic_auth_interactive(config: DeploymentConfig, script_dir: Path, namespace: str = "n8n") -> bool:
     """Interactive basic authentication configuration after deployment
 
@@ -2971,7 +3319,7 @@ def configure_basic_auth_interactive(config: DeploymentConfig, script_dir: Path,
         True if basic auth was configured successfully
     """
     print(f"\n{Colors.HEADER}{Colors.BOLD}Basic Authentication Configuration{Colors.ENDC}")
-    print("=" * 60)
+    print(_SEP)
     print("Protect your n8n instance with basic authentication")
     print()
 
@@ -2982,19 +3330,31 @@ def configure_basic_auth_interactive(config: DeploymentConfig, script_dir: Path,
         print("Your n8n instance will be publicly accessible")
         return False
 
+    # Fail fast if there is no way to produce the bcrypt hash
+    if bcrypt is None and _HTPASSWD is None:
+        print(f"{Colors.FAIL}✗ htpasswd command not found{Colors.ENDC}")
+        print(f"\n{Colors.WARNING}Basic authentication requires the bcrypt package (pip install bcrypt) or htpasswd for bcrypt hashing.{Colors.ENDC}")
+        print(f"\nInstall apache2-utils (Debian/Ubuntu) or httpd-tools (RedHat/CentOS):")
+        print(f"  {Colors.OKCYAN}# Ubuntu/Debian:{Colors.ENDC}")
+        print(f"  {Colors.OKCYAN}sudo apt-get install apache2-utils{Colors.ENDC}")
+        print(f"  {Colors.OKCYAN}# RedHat/CentOS:{Colors.ENDC}")
+        print(f"  {Colors.OKCYAN}sudo yum install httpd-tools{Colors.ENDC}")
+        print(f"  {Colors.OKCYAN}# macOS:{Colors.ENDC}")
+        print(f"  {Colors.OKCYAN}brew install httpd{Colors.ENDC}")
+        return False
+
     # Generate credentials
     config.basic_auth_username = "admin"
-    import string
 
     alphabet = string.ascii_letters + string.digits
     config.basic_auth_password = ''.join(secrets.choice(alphabet) for _ in range(12))
 
     print(f"\n{Colors.OKGREEN}✓ Generated basic auth credentials{Colors.ENDC}")
     print(f"\n{Colors.WARNING}{Colors.BOLD}⚠️  IMPORTANT - Save these credentials!{Colors.ENDC}")
-    print("=" * 60)
+    print(_SEP)
     print(f"Username: {Colors.OKCYAN}{config.basic_auth_username}{Colors.ENDC}")
     print(f"Password: {Colors.OKCYAN}{config.basic_auth_password}{Colors.ENDC}")
-    print("=" * 60)
+    print(_SEP)
     print(f"{Colors.WARNING}These credentials will be required to access n8n{Colors.ENDC}")
     print()
 
@@ -3005,11 +3365,9 @@ def configure_basic_auth_interactive(config: DeploymentConfig, script_dir: Path,
     # Store credentials in AWS Secrets Manager
     print(f"\n{Colors.HEADER}Storing credentials in AWS Secrets Manager...{Colors.ENDC}")
     try:
-        import boto3
-        import botocore
-
-        session = boto3.Session(profile_name=config.aws_profile, region_name=config.aws_region)
-        secrets_client = session.client('secretsmanager')
+        secrets_client = _aws_client('secretsmanager', config.aws_profile, config.aws_region)
+        if secrets_client is None:
+            raise ImportError("boto3 is not installed (pip install boto3)")
 
         secret_value = json.dumps({
             'username': config.basic_auth_username,
@@ -3017,20 +3375,20 @@ def configure_basic_auth_interactive(config: DeploymentConfig, script_dir: Path,
         })
 
         try:
-            # Try to create the secret
+            # Update first: re-runs are the common case and need a single call
+            secrets_client.put_secret_value(
+                SecretId='/n8n/basic-auth',
+                SecretString=secret_value
+            )
+            print(f"{Colors.OKGREEN}✓ Credentials updated in AWS Secrets Manager{Colors.ENDC}")
+        except secrets_client.exceptions.ResourceNotFoundException:
+            # Secret does not exist yet, create it
             secrets_client.create_secret(
                 Name='/n8n/basic-auth',
                 SecretString=secret_value,
                 Description='Basic authentication credentials for n8n ingress'
             )
             print(f"{Colors.OKGREEN}✓ Credentials stored in AWS Secrets Manager{Colors.ENDC}")
-        except secrets_client.exceptions.ResourceExistsException:
-            # Secret already exists, update it
-            secrets_client.put_secret_value(
-                SecretId='/n8n/basic-auth',
-                SecretString=secret_value
-            )
-            print(f"{Colors.OKGREEN}✓ Credentials updated in AWS Secrets Manager{Colors.ENDC}")
 
     except Exception as e:
         print(f"{Colors.FAIL}✗ Failed to store credentials in Secrets Manager: {e}{Colors.ENDC}")
@@ -3039,61 +3397,39 @@ def configure_basic_auth_interactive(config: DeploymentConfig, script_dir: Path,
     # Create htpasswd file content with bcrypt
     print(f"\n{Colors.HEADER}Creating basic auth secret in Kubernetes...{Colors.ENDC}")
     try:
-        # Try using htpasswd command (required for bcrypt)
-        try:
-            result = subprocess.run(
-                ['htpasswd', '-nB', config.basic_auth_username],
-                input=f"{config.basic_auth_password}\n{config.basic_auth_password}\n",
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
+        if bcrypt is not None:
+            hashed = bcrypt.hashpw(config.basic_auth_password.encode('utf-8'),
+                                   bcrypt.gensalt(rounds=_BCRYPT_ROUNDS))
+            auth_content = f"{config.basic_auth_username}:{hashed.decode('ascii')}"
+        else:
+            # bcrypt not installed, fall back to the htpasswd command
+            try:
+                result = subprocess.run(
+                    [_HTPASSWD, '-nB', config.basic_auth_username],
+                    input=f"{config.basic_auth_password}\n{config.basic_auth_password}\n",
+                    capture_output=True,
+                    text=True,
+                    timeout=30
+                )
 
-            if result.returncode == 0:
-                auth_content = result.stdout.strip()
-            else:
-                raise Exception(f"htpasswd command failed: {result.stderr}")
-
-        except FileNotFoundError:
-            print(f"{Colors.FAIL}✗ htpasswd command not found{Colors.ENDC}")
-            print(f"\n{Colors.WARNING}Basic authentication requires htpasswd for bcrypt hashing.{Colors.ENDC}")
-            print(f"\nInstall apache2-utils (Debian/Ubuntu) or httpd-tools (RedHat/CentOS):")
-            print(f"  {Colors.OKCYAN}# Ubuntu/Debian:{Colors.ENDC}")
-            print(f"  {Colors.OKCYAN}sudo apt-get install apache2-utils{Colors.ENDC}")
-            print(f"  {Colors.OKCYAN}# RedHat/CentOS:{Colors.ENDC}")
-            print(f"  {Colors.OKCYAN}sudo yum install httpd-tools{Colors.ENDC}")
-            print(f"  {Colors.OKCYAN}# macOS:{Colors.ENDC}")
-            print(f"  {Colors.OKCYAN}brew install httpd{Colors.ENDC}")
-            return False
-        except subprocess.TimeoutExpired:
-            print(f"{Colors.FAIL}✗ htpasswd command timed out{Colors.ENDC}")
-            return False
+                if result.returncode == 0:
+                    auth_content = result.stdout.strip()
+                else:
+                    raise Exception(f"htpasswd command failed: {result.stderr}")
 
-        # Create Kubernetes secret
-        result = subprocess.run([
-            'kubectl', 'create', 'secret', 'generic', 'n8n-basic-auth',
-            '-n', namespace,
-            f'--from-literal=auth={auth_content}'
-        ], capture_output=True, text=True)
+            except subprocess.TimeoutExpired:
+                print(f"{Colors.FAIL}✗ htpasswd command timed out{Colors.ENDC}")
+                return False
+
+        # Create or update Kubernetes secret
+        result = _apply_secret('n8n-basic-auth', namespace, {'auth': auth_content})
 
         if result.returncode == 0:
             print(f"{Colors.OKGREEN}✓ Basic auth secret created in Kubernetes{Colors.ENDC}")
         else:
-            # Secret might already exist, try to delete and recreate
-            subprocess.run(['kubectl', 'delete', 'secret', 'n8n-basic-auth', '-n', namespace],
-                         capture_output=True)
-            result = subprocess.run([
-                'kubectl', 'create', 'secret', 'generic', 'n8n-basic-auth',
-                '-n', namespace,
-                f'--from-literal=auth={auth_content}'
-            ], capture_output=True, text=True)
-
-            if result.returncode == 0:
-                print(f"{Colors.OKGREEN}✓ Basic auth secret created in Kubernetes{Colors.ENDC}")
-            else:
-                print(f"{Colors.FAIL}✗ Failed to create basic auth secret{Colors.ENDC}")
-                print(result.stderr)
-                return False
+            print(f"{Colors.FAIL}✗ Failed to create basic auth secret{Colors.ENDC}")
+            print(result.stderr)
+            return False
 
     except Exception as e:
         print(f"{Colors.FAIL}✗ Error creating basic auth secret: {e}{Colors.ENDC}")
@@ -3102,13 +3438,26 @@ def configure_basic_auth_interactive(config: DeploymentConfig, script_dir: Path,
     # Upgrade n8n Helm release with basic auth enabled
     print(f"\n{Colors.HEADER}Enabling basic auth in n8n ingress...{Colors.ENDC}")
     try:
+        # Annotate the ingress directly (same annotations the chart renders for
+        # ingress.basicAuth); a single API call instead of a full Helm re-render
         result = subprocess.run([
-            'helm', 'upgrade', 'n8n', str(script_dir / 'charts' / 'n8n'),
-            '-n', namespace,
-            '--reuse-values',
-            '--set', 'ingress.basicAuth.enabled=true',
-            '--set', 'ingress.basicAuth.secretName=n8n-basic-auth'
-        ], capture_output=True, text=True, timeout=180)
+            'kubectl', 'annotate', 'ingress', 'n8n', '-n', namespace,
+            'nginx.ingress.kubernetes.io/auth-type=basic',
+            'nginx.ingress.kubernetes.io/auth-secret=n8n-basic-auth',
+            'nginx.ingress.kubernetes.io/auth-realm=Authentication Required - N8N',
+            '--overwrite'
+        ], capture_output=True, text=True, timeout=30)
+
+        if result.returncode != 0:
+            # Fall back to Helm, e.g. when the ingress does not exist yet
+            result = subprocess.run([
+                'helm', 'upgrade', 'n8n', str(script_dir / 'charts' / 'n8n'),
+                '-n', namespace,
+                '--reuse-values',
+                '--wait=false',
+                '--set', 'ingress.basicAuth.enabled=true',
+                '--set', 'ingress.basicAuth.secretName=n8n-basic-auth'
+            ], capture_output=True, text=True, timeout=180)
 
         if result.returncode == 0:
             print(f"{Colors.OKGREEN}✓ Basic auth enabled on n8n ingress{Colors.ENDC}")
@@ -3128,192 +3477,365 @@ def configure_basic_auth_interactive(config: DeploymentConfig, script_dir: Path,
     try:
         tfvars_path = script_dir / "terraform" / "aws" / "terraform.tfvars"
         if tfvars_path.exists():
-            content = tfvars_path.read_text()
-            # Update enable_basic_auth value
-            import re
-            content = re.sub(
-                r'enable_basic_auth\s*=\s*(true|false)',
-                'enable_basic_auth  = true',
-                content
-            )
-            tfvars_path.write_text(content)
+            # Update enable_basic_auth value in place
+            with open(tfvars_path, 'r+') as f:
+                content = _TFVARS_BASIC_AUTH_RE.sub('enable_basic_auth  = true', f.read())
+                f.seek(0)
+                f.write(content)
+                f.truncate()
             print(f"{Colors.OKGREEN}✓ Updated terraform.tfvars with basic auth state{Colors.ENDC}")
     except Exception as e:
         print(f"{Colors.WARNING}⚠ Could not update terraform.tfvars: {e}{Colors.ENDC}")
         print(f"{Colors.WARNING}  Basic auth is enabled but not tracked in Terraform state{Colors.ENDC}")
 
     print(f"\n{Colors.OKGREEN}{Colors.BOLD}✅ Basic Authentication Configured!{Colors.ENDC}")
-    print("\n" + "=" * 60)
+    print("\n" + _SEP)
     print(f"Basic auth is now required to access n8n")
     print(f"Username: {Colors.OKCYAN}{config.basic_auth_username}{Colors.ENDC}")
     print(f"Password: {Colors.OKCYAN}{config.basic_auth_password}{Colors.ENDC}")
-    print("=" * 60)
+    print(_SEP)
 
     return True
 
-class TeardownRunner:
-    """Handles teardown of N8N EKS deployment"""
+def _teardown_countdown(seconds: int = 5) -> bool:
+    """Give the user a last chance to cancel with Ctrl+C
 
-    def __init__(self, script_dir: Path, config: DeploymentConfig):
-        self.script_dir = script_dir
-        self.config = config
-        self.terraform_dir = script_dir / "terraform" / "aws"
+    The countdown is only shown on an interactive terminal; there is nobody to
+    press Ctrl+C on a non-TTY run, so it is skipped there.
 
-    def phase1_helm_releases(self) -> bool:
-        """Phase 1: Uninstall Helm releases"""
-        print(f"\n{Colors.HEADER}{Colors.BOLD}📦 PHASE 1: Uninstalling Helm Releases{Colors.ENDC}")
-        print("=" * 60)
+    Returns:
+        False if the user cancelled
+    """
+    if not sys.stdout.isatty():
+        return True
 
-        # Check if cluster is accessible
-        try:
-            result = subprocess.run(
-                ['kubectl', 'cluster-info'],
-                capture_output=True,
-                timeout=10
-            )
-            if result.returncode != 0:
-                print(f"{Colors.WARNING}⚠  Cluster not accessible, skipping Helm cleanup{Colors.ENDC}")
-                print(f"{Colors.WARNING}  If cluster still exists, manually uninstall: helm uninstall n8n -n {self.config.n8n_namespace}{Colors.ENDC}")
-                return True
-        except Exception as e:
-            print(f"{Colors.WARNING}⚠  Cannot verify cluster access: {e}{Colors.ENDC}")
-            return True
+    print(f"\n{Colors.RED}{Colors.BOLD}Starting teardown in {seconds} seconds... Press Ctrl+C to cancel{Colors.ENDC}")
+    tick = threading.Event()
+    try:
+        for i in range(seconds, 0, -1):
+            print(f"{i}...")
+            tick.wait(1.0)
+    except KeyboardInterrupt:
+        return False
+    return True
 
-        success = True
 
-        # Uninstall n8n
-        print(f"\n{Colors.OKCYAN}Checking for n8n Helm release...{Colors.ENDC}")
+class KubeProxy:
+    """A `kubectl proxy` that Kubernetes API calls can share
+
+    Each kubectl invocation reloads kubeconfig, runs the credential plugin and
+    opens a new TLS connection. Requests sent through one proxy pay that once.
+    `url` stays None when the proxy could not be started, and callers fall back
+    to plain kubectl.
+    """
+
+    def __init__(self):
+        self._process = None
+        self.url: Optional[str] = None
+        # Talk to the local kubectl proxy directly, ignoring any http_proxy settings
+        self._http = urllib.request.build_opener(urllib.request.ProxyHandler({}))
+
+    def start(self):
+        """Start the proxy on a free local port"""
         try:
-            result = subprocess.run(
-                ['helm', 'list', '-n', self.config.n8n_namespace, '-o', 'json'],
-                capture_output=True,
-                text=True,
-                timeout=30
+            self._process = subprocess.Popen(
+                ['kubectl', 'proxy', '--port=0'],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True
             )
+            # kubectl prints "Starting to serve on 127.0.0.1:PORT" once listening
+            ready, _, _ = select.select([self._process.stdout], [], [], 10)
+            line = self._process.stdout.readline() if ready else ''
+            if 'Starting to serve on' in line:
+                self.url = f"http://{line.strip().rsplit(' ', 1)[-1]}"
+            else:
+                self.stop()
+        except Exception:
+            self.stop()
 
-            if result.returncode == 0:
-                releases = json.loads(result.stdout) if result.stdout.strip() else []
-                n8n_found = any(r.get('name') == 'n8n' for r in releases)
+    def stop(self):
+        """Terminate the proxy started by start()"""
+        if self._process is not None:
+            self._process.terminate()
+            try:
+                self._process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+        self._process = None
+        self.url = None
 
-                if n8n_found:
-                    print(f"{Colors.OKCYAN}  Uninstalling n8n...{Colors.ENDC}")
-                    result = subprocess.run(
-                        ['helm', 'uninstall', 'n8n', '-n', self.config.n8n_namespace],
-                        capture_output=True,
-                        text=True,
-                        timeout=60
-                    )
-                    if result.returncode == 0:
-                        print(f"{Colors.OKGREEN}  ✓ n8n uninstalled{Colors.ENDC}")
-                    else:
-                        print(f"{Colors.FAIL}  ✗ Failed to uninstall n8n{Colors.ENDC}")
-                        print(f"  {result.stderr}")
-                        success = False
+    def request(self, method: str, path: str) -> int:
+        """Send a request through the proxy and return the HTTP status"""
+        request = urllib.request.Request(self.url + path, method=method)
+        try:
+            with self._http.open(request, timeout=10) as response:
+                return response.status
+        except urllib.error.HTTPError as e:
+            return e.code
+
+
+class TeardownRunner:
+    """Handles teardown of N8N EKS deployment"""
+
+    def __init__(self, script_dir: Path, config: DeploymentConfig):
+        self.script_dir = script_dir
+        self.config = config
+        self.terraform_dir = script_dir / "terraform" / "aws"
+        self.aws_region = config.aws_region or "us-east-1"
+        # Built once and shared by every aws CLI call
+        self._aws_env = {**os.environ, 'AWS_PROFILE': config.aws_profile} if config.aws_profile else os.environ
+        self._print_lock = threading.Lock()
+        # For EKS every kubectl invocation runs `aws eks get-token`; going
+        # through the proxy pays that cost once for the whole teardown
+        self._kube = KubeProxy()
+        self._cluster_reachable: Optional[bool] = None
+
+    def _check_cluster(self) -> bool:
+        """Check once whether the cluster is reachable and reuse the answer"""
+        if self._cluster_reachable is None:
+            try:
+                if self._kube.url:
+                    self._cluster_reachable = self._kube.request('GET', '/readyz') == 200
                 else:
-                    print(f"{Colors.OKCYAN}  n8n Helm release not found{Colors.ENDC}")
-        except Exception as e:
-            print(f"{Colors.WARNING}  Error checking n8n release: {e}{Colors.ENDC}")
-            success = False
+                    result = _run_silent(['kubectl', 'cluster-info'], timeout=10)
+                    self._cluster_reachable = result.returncode == 0
+            except Exception:
+                self._cluster_reachable = False
+        return self._cluster_reachable
+
+    def _namespace_exists(self, namespace: str) -> bool:
+        """Check whether a namespace exists"""
+        if self._kube.url:
+            return self._kube.request('GET', f'/api/v1/namespaces/{namespace}') == 200
+        return _run_silent(['kubectl', 'get', 'namespace', namespace], timeout=10).returncode == 0
+
+    def _log(self, *lines: str):
+        """Print lines as one block so output from worker threads doesn't interleave"""
+        with self._print_lock:
+            print('\n'.join(lines))
+
+    @property
+    def secrets(self):
+        """Cached Secrets Manager client (None without boto3)"""
+        return _aws_client('secretsmanager', self.config.aws_profile, self.aws_region)
+
+    @property
+    def rds(self):
+        """Cached RDS client (None without boto3)"""
+        return _aws_client('rds', self.config.aws_profile, self.aws_region)
+
+    def _aws_cli(self, args: list) -> subprocess.CompletedProcess:
+        """Run an AWS CLI command for the configured profile and region"""
+        return subprocess.run(
+            ['aws'] + args + ['--region', self.aws_region],
+            capture_output=True,
+            text=True,
+            timeout=30,
+            env=self._aws_env
+        )
+
+    @staticmethod
+    def _state_resources(module: Dict):
+        """Yield every resource of a `terraform show -json` module, including child modules"""
+        yield from module.get('resources', [])
+        for child in module.get('child_modules', []):
+            yield from TeardownRunner._state_resources(child)
+
+    def _disable_rds_deletion_protection(self, rds_id: str) -> bool:
+        """Disable deletion protection on the RDS instance"""
+        if self.rds is not None:
+            try:
+                self.rds.modify_db_instance(DBInstanceIdentifier=rds_id,
+                                            DeletionProtection=False,
+                                            ApplyImmediately=True)
+                return True
+            except Exception:
+                return False
+
+        result = self._aws_cli(['rds', 'modify-db-instance',
+                                '--db-instance-identifier', rds_id,
+                                '--no-deletion-protection',
+                                '--apply-immediately'])
+        return result.returncode == 0
+
+    @property
+    def elbv2(self):
+        """Cached ELBv2 client (None without boto3)"""
+        return _aws_client('elbv2', self.config.aws_profile, self.aws_region)
 
-        # Uninstall ingress-nginx
-        print(f"\n{Colors.OKCYAN}Checking for ingress-nginx Helm release...{Colors.ENDC}")
+    @staticmethod
+    def _lb_hostname(namespace: str) -> Optional[str]:
+        """Return the hostname of the first LoadBalancer Service in a namespace"""
         try:
             result = subprocess.run(
-                ['helm', 'list', '-n', 'ingress-nginx', '-o', 'json'],
+                ['kubectl', 'get', 'svc', '-n', namespace,
+                 '-o', 'jsonpath={.items[*].status.loadBalancer.ingress[*].hostname}'],
                 capture_output=True,
                 text=True,
-                timeout=30
+                timeout=10
             )
+            hostnames = result.stdout.split() if result.returncode == 0 else []
+            return hostnames[0] if hostnames else None
+        except Exception:
+            return None
 
-            if result.returncode == 0:
-                releases = json.loads(result.stdout) if result.stdout.strip() else []
-                nginx_found = any(r.get('name') == 'ingress-nginx' for r in releases)
+    def _lb_exists(self, hostname: str) -> bool:
+        """Check whether a load balancer with the given DNS name still exists"""
+        if self.elbv2 is not None:
+            paginator = self.elbv2.get_paginator('describe_load_balancers')
+            return any(lb.get('DNSName') == hostname
+                       for page in paginator.paginate()
+                       for lb in page.get('LoadBalancers', []))
 
-                if nginx_found:
-                    print(f"{Colors.OKCYAN}  Uninstalling ingress-nginx...{Colors.ENDC}")
-                    result = subprocess.run(
-                        ['helm', 'uninstall', 'ingress-nginx', '-n', 'ingress-nginx'],
-                        capture_output=True,
-                        text=True,
-                        timeout=60
-                    )
-                    if result.returncode == 0:
-                        print(f"{Colors.OKGREEN}  ✓ ingress-nginx uninstalled{Colors.ENDC}")
-                        print(f"{Colors.OKCYAN}  Waiting for LoadBalancer to be deleted...{Colors.ENDC}")
-                        import time
-                        time.sleep(30)
-                    else:
-                        print(f"{Colors.FAIL}  ✗ Failed to uninstall ingress-nginx{Colors.ENDC}")
-                        print(f"  {result.stderr}")
-                        success = False
-                else:
-                    print(f"{Colors.OKCYAN}  ingress-nginx Helm release not found{Colors.ENDC}")
-        except Exception as e:
-            print(f"{Colors.WARNING}  Error checking ingress-nginx release: {e}{Colors.ENDC}")
-            success = False
+        result = self._aws_cli(['elbv2', 'describe-load-balancers',
+                                '--query', f"LoadBalancers[?DNSName=='{hostname}'] | length(@)",
+                                '--output', 'text'])
+        return result.returncode == 0 and result.stdout.strip() not in ('', '0')
+
+    def _wait_lb_deleted(self, hostname: Optional[str], timeout: int = 180):
+        """Wait until the load balancer is gone instead of sleeping a fixed time
+
+        Falls back to the previous fixed 30s wait when the hostname is unknown.
+        """
+        if not hostname:
+            time.sleep(30)
+            return
+
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            try:
+                if not self._lb_exists(hostname):
+                    self._log(f"{Colors.OKGREEN}  ✓ LoadBalancer deleted{Colors.ENDC}")
+                    return
+            except Exception:
+                pass
+            time.sleep(3)
+        self._log(f"{Colors.WARNING}  ⚠ LoadBalancer still present after {timeout}s, continuing{Colors.ENDC}")
+
+    def _list_n8n_secrets(self) -> Tuple[Optional[List[str]], str]:
+        """List the names of n8n-related secrets in Secrets Manager
+
+        Returns:
+            Tuple of (secret_names, error); secret_names is None on failure
+        """
+        if self.secrets is not None:
+            paginator = self.secrets.get_paginator('list_secrets')
+            names = [secret['Name']
+                     for page in paginator.paginate()
+                     for secret in page.get('SecretList', [])
+                     if 'n8n' in secret['Name']]
+            return names, ""
+
+        result = self._aws_cli(['secretsmanager', 'list-secrets',
+                                '--query', 'SecretList[?contains(Name, `n8n`)].Name',
+                                '--output', 'json'])
+        if result.returncode != 0:
+            return None, result.stderr
+        return (_json_loads(result.stdout) if result.stdout.strip() else []), ""
+
+    def _delete_secret(self, secret: str) -> bool:
+        """Force-delete a secret without a recovery window"""
+        if self.secrets is not None:
+            try:
+                self.secrets.delete_secret(SecretId=secret, ForceDeleteWithoutRecovery=True)
+                return True
+            except Exception:
+                return False
+
+        result = self._aws_cli(['secretsmanager', 'delete-secret',
+                                '--secret-id', secret,
+                                '--force-delete-without-recovery'])
+        return result.returncode == 0
+
+    def phase1_helm_releases(self) -> bool:
+        """Phase 1: Uninstall Helm releases"""
+        print(f"\n{Colors.HEADER}{Colors.BOLD}📦 PHASE 1: Uninstalling Helm Releases{Colors.ENDC}")
+        print(_SEP)
+
+        # Check if cluster is accessible
+        if not self._check_cluster():
+            print(f"{Colors.WARNING}⚠  Cluster not accessible, skipping Helm cleanup{Colors.ENDC}")
+            print(f"{Colors.WARNING}  If cluster still exists, manually uninstall: helm uninstall n8n -n {self.config.n8n_namespace}{Colors.ENDC}")
+            return True
+
+        # Releases live in different namespaces, so probe and uninstall them concurrently
+        releases = [
+            # (release, namespace, failure fails the phase, wait for its LoadBalancer to go)
+            ('n8n', self.config.n8n_namespace, True, False),
+            ('ingress-nginx', 'ingress-nginx', True, True),
+            ('cert-manager', 'cert-manager', False, False),
+        ]
+        with ThreadPoolExecutor(max_workers=len(releases)) as executor:
+            results = list(executor.map(lambda r: self._probe_and_uninstall(*r), releases))
+
+        return all(results)
+
+    def _probe_and_uninstall(self, release: str, namespace: str, required: bool = True,
+                             wait_for_lb: bool = False) -> bool:
+        """Uninstall a Helm release if it is installed
+
+        Args:
+            release: Helm release name
+            namespace: Namespace the release is installed in
+            required: Whether a failure should fail the teardown phase
+            wait_for_lb: Wait for the release's AWS LoadBalancer to be deleted
 
-        # Uninstall cert-manager if exists
-        print(f"\n{Colors.OKCYAN}Checking for cert-manager Helm release...{Colors.ENDC}")
+        Returns:
+            False if the release could not be checked or uninstalled and is required
+        """
+        self._log(f"\n{Colors.OKCYAN}Checking for {release} Helm release...{Colors.ENDC}")
         try:
+            # helm status fails when the release is absent, so this is a single
+            # existence probe instead of listing and scanning every release
             result = subprocess.run(
-                ['helm', 'list', '-n', 'cert-manager', '-o', 'json'],
+                ['helm', 'status', release, '-n', namespace],
                 capture_output=True,
                 text=True,
-                timeout=30
+                timeout=15
             )
 
             if result.returncode == 0:
-                releases = json.loads(result.stdout) if result.stdout.strip() else []
-                cert_manager_found = any(r.get('name') == 'cert-manager' for r in releases)
-
-                if cert_manager_found:
-                    print(f"{Colors.OKCYAN}  Uninstalling cert-manager...{Colors.ENDC}")
-                    result = subprocess.run(
-                        ['helm', 'uninstall', 'cert-manager', '-n', 'cert-manager'],
-                        capture_output=True,
-                        text=True,
-                        timeout=60
-                    )
-                    if result.returncode == 0:
-                        print(f"{Colors.OKGREEN}  ✓ cert-manager uninstalled{Colors.ENDC}")
-                    else:
-                        print(f"{Colors.FAIL}  ✗ Failed to uninstall cert-manager{Colors.ENDC}")
-                        print(f"  {result.stderr}")
+                # Remember the LoadBalancer before the Service goes away
+                lb_hostname = self._lb_hostname(namespace) if wait_for_lb else None
+                self._log(f"{Colors.OKCYAN}  Uninstalling {release}...{Colors.ENDC}")
+                result = subprocess.run(
+                    ['helm', 'uninstall', release, '-n', namespace],
+                    capture_output=True,
+                    text=True,
+                    timeout=60
+                )
+                if result.returncode == 0:
+                    self._log(f"{Colors.OKGREEN}  ✓ {release} uninstalled{Colors.ENDC}")
+                    if wait_for_lb:
+                        self._log(f"{Colors.OKCYAN}  Waiting for LoadBalancer to be deleted...{Colors.ENDC}")
+                        self._wait_lb_deleted(lb_hostname)
                 else:
-                    print(f"{Colors.OKCYAN}  cert-manager Helm release not found{Colors.ENDC}")
+                    self._log(f"{Colors.FAIL}  ✗ Failed to uninstall {release}{Colors.ENDC}",
+                              f"  {result.stderr}")
+                    return not required
+            else:
+                self._log(f"{Colors.OKCYAN}  {release} Helm release not found{Colors.ENDC}")
         except Exception as e:
-            print(f"{Colors.WARNING}  Error checking cert-manager release: {e}{Colors.ENDC}")
+            self._log(f"{Colors.WARNING}  Error checking {release} release: {e}{Colors.ENDC}")
+            return not required
 
-        return success
+        return True
 
     def phase2_kubernetes_resources(self) -> bool:
         """Phase 2: Clean Kubernetes resources"""
         print(f"\n{Colors.HEADER}{Colors.BOLD}🧹 PHASE 2: Cleaning Kubernetes Resources{Colors.ENDC}")
-        print("=" * 60)
+        print(_SEP)
 
         # Check if cluster is accessible
-        try:
-            result = subprocess.run(
-                ['kubectl', 'cluster-info'],
-                capture_output=True,
-                timeout=10
-            )
-            if result.returncode != 0:
-                print(f"{Colors.WARNING}⚠  Cluster not accessible, skipping Kubernetes cleanup{Colors.ENDC}")
-                return True
-        except Exception:
-            print(f"{Colors.WARNING}⚠  Cannot verify cluster access, skipping Kubernetes cleanup{Colors.ENDC}")
+        if not self._check_cluster():
+            print(f"{Colors.WARNING}⚠  Cluster not accessible, skipping Kubernetes cleanup{Colors.ENDC}")
             return True
 
         # Delete PVCs
         print(f"\n{Colors.OKCYAN}Deleting PersistentVolumeClaims...{Colors.ENDC}")
         try:
-            result = subprocess.run(
-                ['kubectl', 'get', 'namespace', self.config.n8n_namespace],
-                capture_output=True,
-                timeout=10
-            )
-            if result.returncode == 0:
+            if self._namespace_exists(self.config.n8n_namespace):
                 result = subprocess.run(
                     ['kubectl', 'delete', 'pvc', '--all', '-n', self.config.n8n_namespace, '--timeout=60s'],
                     capture_output=True,
@@ -3329,47 +3851,88 @@ class TeardownRunner:
 
         # Delete secrets
         print(f"\n{Colors.OKCYAN}Deleting manual secrets...{Colors.ENDC}")
-        for secret_name in ['n8n-basic-auth', 'n8n-tls', 'n8n-db-credentials']:
-            try:
-                subprocess.run(
-                    ['kubectl', 'delete', 'secret', secret_name, '-n', self.config.n8n_namespace],
-                    capture_output=True,
-                    timeout=10
-                )
-            except Exception:
-                pass
+        secret_names = ['n8n-basic-auth', 'n8n-tls', 'n8n-db-credentials']
+        try:
+            if self._kube.url:
+                with ThreadPoolExecutor(max_workers=len(secret_names)) as executor:
+                    list(executor.map(self._delete_k8s_secret, secret_names))
+            else:
+                _run_silent(['kubectl', 'delete', 'secret', *secret_names,
+                             '-n', self.config.n8n_namespace, '--ignore-not-found'])
+        except Exception:
+            pass
         print(f"{Colors.OKGREEN}  ✓ Secrets cleanup complete{Colors.ENDC}")
 
-        # Delete namespaces
+        # Delete namespaces (after the PVCs above) with a single kubectl call.
+        # --wait=false returns once the deletions are accepted, so the
+        # namespaces finalize together; the n8n namespace is then waited on,
+        # because its PVC-backed EBS volumes are not in terraform state and a
+        # destroy racing their deletion can leak them or fail on ENIs/SGs
         print(f"\n{Colors.OKCYAN}Deleting namespaces...{Colors.ENDC}")
-        for namespace in [self.config.n8n_namespace, 'ingress-nginx', 'cert-manager']:
-            try:
+        try:
+            namespaces = self._existing_namespaces(
+                [self.config.n8n_namespace, 'ingress-nginx', 'cert-manager'])
+            if namespaces:
+                for namespace in namespaces:
+                    print(f"{Colors.OKCYAN}  Deleting namespace: {namespace}...{Colors.ENDC}")
                 result = subprocess.run(
-                    ['kubectl', 'get', 'namespace', namespace],
+                    ['kubectl', 'delete', 'namespace', *namespaces,
+                     '--ignore-not-found', '--wait=false', '--cascade=background'],
                     capture_output=True,
-                    timeout=10
+                    text=True,
+                    timeout=30
                 )
-                if result.returncode == 0:
-                    print(f"{Colors.OKCYAN}  Deleting namespace: {namespace}...{Colors.ENDC}")
-                    result = subprocess.run(
-                        ['kubectl', 'delete', 'namespace', namespace, '--timeout=120s'],
+                for namespace in namespaces:
+                    if result.returncode == 0:
+                        print(f"{Colors.OKGREEN}    ✓ {namespace} deletion requested{Colors.ENDC}")
+                    else:
+                        print(f"{Colors.WARNING}    ⚠ {namespace} deletion error{Colors.ENDC}")
+
+                if result.returncode == 0 and self.config.n8n_namespace in namespaces:
+                    print(f"{Colors.OKCYAN}  Waiting for namespace {self.config.n8n_namespace} "
+                          f"and its volumes to be deleted...{Colors.ENDC}")
+                    wait = subprocess.run(
+                        ['kubectl', 'wait', '--for=delete', f'namespace/{self.config.n8n_namespace}',
+                         '--timeout=300s'],
                         capture_output=True,
                         text=True,
-                        timeout=130
+                        timeout=310
                     )
-                    if result.returncode == 0:
-                        print(f"{Colors.OKGREEN}    ✓ {namespace} deleted{Colors.ENDC}")
+                    if wait.returncode == 0:
+                        print(f"{Colors.OKGREEN}    ✓ {self.config.n8n_namespace} deleted{Colors.ENDC}")
                     else:
-                        print(f"{Colors.WARNING}    ⚠ {namespace} deletion timeout or error{Colors.ENDC}")
-            except Exception as e:
-                print(f"{Colors.WARNING}  Error with namespace {namespace}: {e}{Colors.ENDC}")
+                        print(f"{Colors.WARNING}    ⚠ {self.config.n8n_namespace} still terminating; "
+                              f"check for leftover EBS volumes after teardown{Colors.ENDC}")
+        except Exception as e:
+            print(f"{Colors.WARNING}  Error deleting namespaces: {e}{Colors.ENDC}")
 
         return True
 
+    def _delete_k8s_secret(self, secret_name: str):
+        """Delete a secret from the n8n namespace through kubectl proxy, ignoring errors"""
+        try:
+            self._kube.request('DELETE', f'/api/v1/namespaces/{self.config.n8n_namespace}/secrets/{secret_name}')
+        except Exception:
+            pass
+
+    def _existing_namespaces(self, namespaces: list) -> list:
+        """Return the namespaces from the list that exist in the cluster"""
+        if self._kube.url:
+            return [namespace for namespace in namespaces if self._namespace_exists(namespace)]
+        result = subprocess.run(
+            ['kubectl', 'get', 'namespace', *namespaces, '--ignore-not-found',
+             '-o', 'jsonpath={.items[*].metadata.name}'],
+            capture_output=True,
+            text=True,
+            timeout=10
+        )
+        found = set(result.stdout.split()) if result.returncode == 0 else set()
+        return [namespace for namespace in namespaces if namespace in found]
+
     def phase3_terraform_destroy(self) -> bool:
         """Phase 3: Destroy Terraform infrastructure"""
         print(f"\n{Colors.HEADER}{Colors.BOLD}💥 PHASE 3: Destroying Terraform Infrastructure{Colors.ENDC}")
-        print("=" * 60)
+        print(_SEP)
 
         tfstate_path = self.terraform_dir / "terraform.tfstate"
         if not tfstate_path.exists():
@@ -3377,80 +3940,40 @@ class TeardownRunner:
             print(f"{Colors.WARNING}  If resources exist in AWS, manually run: cd terraform && terraform destroy{Colors.ENDC}")
             return True
 
-        # Detect AWS region
-        aws_region = self.config.aws_region or "us-east-1"
-
         # Check for RDS deletion protection
         print(f"\n{Colors.OKCYAN}Checking for RDS deletion protection...{Colors.ENDC}")
         try:
+            # One structured dump of the state instead of `state list` + `state show`
             result = subprocess.run(
-                ['terraform', '-chdir=' + str(self.terraform_dir), 'state', 'list'],
+                ['terraform', '-chdir=' + str(self.terraform_dir), 'show', '-json'],
                 capture_output=True,
-                text=True,
-                timeout=30
+                timeout=60
             )
 
-            if result.returncode == 0 and 'aws_db_instance' in result.stdout:
-                print(f"{Colors.OKCYAN}  RDS instance detected, checking deletion protection...{Colors.ENDC}")
+            rds_instances = []
+            if result.returncode == 0 and result.stdout.strip():
+                state = _json_loads(result.stdout)
+                root_module = state.get('values', {}).get('root_module', {})
+                rds_instances = [r.get('values', {}) for r in self._state_resources(root_module)
+                                 if r.get('type') == 'aws_db_instance']
 
-                # Get RDS instance ID from state
-                rds_resources = [line for line in result.stdout.split('\n') if 'aws_db_instance' in line]
-                if rds_resources:
-                    rds_resource = rds_resources[0]
+            if rds_instances:
+                print(f"{Colors.OKCYAN}  RDS instance detected, checking deletion protection...{Colors.ENDC}")
+                rds = rds_instances[0]
+                rds_id = rds.get('identifier')
 
-                    # Show the RDS resource details
-                    result = subprocess.run(
-                        ['terraform', '-chdir=' + str(self.terraform_dir), 'state', 'show', rds_resource],
-                        capture_output=True,
-                        text=True,
-                        timeout=30
-                    )
+                if rds_id and rds.get('deletion_protection') is True:
+                    print(f"{Colors.WARNING}  ⚠ RDS deletion protection is enabled{Colors.ENDC}")
+                    print(f"{Colors.OKCYAN}  Disabling deletion protection...{Colors.ENDC}")
 
-                    if result.returncode == 0:
-                        # Extract RDS ID from the output
-                        for line in result.stdout.split('\n'):
-                            if 'identifier ' in line and '=' in line:
-                                rds_id = line.split('=')[1].strip().strip('"')
-
-                                # Check deletion protection via AWS CLI
-                                try:
-                                    check_result = subprocess.run(
-                                        ['aws', 'rds', 'describe-db-instances',
-                                         '--db-instance-identifier', rds_id,
-                                         '--region', aws_region,
-                                         '--query', 'DBInstances[0].DeletionProtection',
-                                         '--output', 'text'],
-                                        capture_output=True,
-                                        text=True,
-                                        timeout=30,
-                                        env={**os.environ, 'AWS_PROFILE': self.config.aws_profile}
-                                    )
-
-                                    if check_result.returncode == 0 and check_result.stdout.strip().upper() == 'TRUE':
-                                        print(f"{Colors.WARNING}  ⚠ RDS deletion protection is enabled{Colors.ENDC}")
-                                        print(f"{Colors.OKCYAN}  Disabling deletion protection...{Colors.ENDC}")
-
-                                        mod_result = subprocess.run(
-                                            ['aws', 'rds', 'modify-db-instance',
-                                             '--db-instance-identifier', rds_id,
-                                             '--no-deletion-protection',
-                                             '--apply-immediately',
-                                             '--region', aws_region],
-                                            capture_output=True,
-                                            text=True,
-                                            timeout=30,
-                                            env={**os.environ, 'AWS_PROFILE': self.config.aws_profile}
-                                        )
-
-                                        if mod_result.returncode == 0:
-                                            print(f"{Colors.OKGREEN}    ✓ Deletion protection disabled{Colors.ENDC}")
-                                            import time
-                                            time.sleep(10)
-                                        else:
-                                            print(f"{Colors.WARNING}    ⚠ Could not disable deletion protection{Colors.ENDC}")
-                                except Exception as e:
-                                    print(f"{Colors.WARNING}  Could not check/disable deletion protection: {e}{Colors.ENDC}")
-                                break
+                    try:
+                        if self._disable_rds_deletion_protection(rds_id):
+                            print(f"{Colors.OKGREEN}    ✓ Deletion protection disabled{Colors.ENDC}")
+                            time.sleep(10)
+                        else:
+                            print(f"{Colors.WARNING}    ⚠ Could not disable deletion protection{Colors.ENDC}")
+                    except Exception as e:
+                        print(f"{Colors.WARNING}  Could not disable deletion protection: {e}{Colors.ENDC}")
         except Exception as e:
             print(f"{Colors.WARNING}  Error checking RDS: {e}{Colors.ENDC}")
 
@@ -3458,9 +3981,23 @@ class TeardownRunner:
         print(f"\n{Colors.WARNING}{Colors.BOLD}⚠️  Running Terraform Destroy{Colors.ENDC}")
         print(f"{Colors.WARNING}This will permanently delete all infrastructure resources!{Colors.ENDC}\n")
 
+        # Plan the destroy once and apply that plan; the teardown was already
+        # confirmed in run(), so -auto-approve does not skip a user decision.
+        # Output is not captured so progress streams to the terminal.
+        plan_file = self.terraform_dir / "tfplan.destroy"
         try:
             result = subprocess.run(
-                ['terraform', '-chdir=' + str(self.terraform_dir), 'destroy'],
+                ['terraform', '-chdir=' + str(self.terraform_dir), 'plan', '-destroy',
+                 f'-out={plan_file.name}', '-input=false', '-parallelism=20'],
+                timeout=600
+            )
+            if result.returncode != 0:
+                print(f"\n{Colors.FAIL}✗ Terraform destroy plan failed{Colors.ENDC}")
+                return False
+
+            result = subprocess.run(
+                ['terraform', '-chdir=' + str(self.terraform_dir), 'apply', '-auto-approve',
+                 '-input=false', '-parallelism=20', plan_file.name],
                 timeout=1800  # 30 minutes timeout
             )
 
@@ -3476,30 +4013,19 @@ class TeardownRunner:
         except Exception as e:
             print(f"\n{Colors.FAIL}✗ Error running terraform destroy: {e}{Colors.ENDC}")
             return False
+        finally:
+            plan_file.unlink(missing_ok=True)
 
     def phase4_secrets_manager(self) -> bool:
         """Phase 4: Clean AWS Secrets Manager"""
         print(f"\n{Colors.HEADER}{Colors.BOLD}🔐 PHASE 4: Cleaning AWS Secrets Manager{Colors.ENDC}")
-        print("=" * 60)
-
-        aws_region = self.config.aws_region or "us-east-1"
+        print(_SEP)
 
         print(f"\n{Colors.OKCYAN}Searching for n8n-related secrets...{Colors.ENDC}")
         try:
-            result = subprocess.run(
-                ['aws', 'secretsmanager', 'list-secrets',
-                 '--region', aws_region,
-                 '--query', 'SecretList[?contains(Name, `n8n`)].Name',
-                 '--output', 'json'],
-                capture_output=True,
-                text=True,
-                timeout=30,
-                env={**os.environ, 'AWS_PROFILE': self.config.aws_profile}
-            )
-
-            if result.returncode == 0:
-                secrets = json.loads(result.stdout) if result.stdout.strip() else []
+            secrets, error = self._list_n8n_secrets()
 
+            if secrets is not None:
                 if not secrets:
                     print(f"{Colors.OKCYAN}  No n8n-related secrets found{Colors.ENDC}")
                 else:
@@ -3509,21 +4035,14 @@ class TeardownRunner:
 
                     prompt = ConfigurationPrompt()
                     if prompt.prompt_yes_no("\nDelete these secrets from AWS Secrets Manager?", default=True):
-                        for secret in secrets:
-                            print(f"{Colors.OKCYAN}  Deleting: {secret}...{Colors.ENDC}")
+                        # Deletes are independent; run them concurrently over the shared
+                        # client (already created by the listing above)
+                        print(f"{Colors.OKCYAN}  Deleting {len(secrets)} secret(s)...{Colors.ENDC}")
+                        with ThreadPoolExecutor(max_workers=min(8, len(secrets))) as executor:
+                            futures = {secret: executor.submit(self._delete_secret, secret) for secret in secrets}
+                        for secret, future in futures.items():
                             try:
-                                del_result = subprocess.run(
-                                    ['aws', 'secretsmanager', 'delete-secret',
-                                     '--secret-id', secret,
-                                     '--region', aws_region,
-                                     '--force-delete-without-recovery'],
-                                    capture_output=True,
-                                    text=True,
-                                    timeout=30,
-                                    env={**os.environ, 'AWS_PROFILE': self.config.aws_profile}
-                                )
-
-                                if del_result.returncode == 0:
+                                if future.result():
                                     print(f"{Colors.OKGREEN}    ✓ Deleted: {secret}{Colors.ENDC}")
                                 else:
                                     print(f"{Colors.WARNING}    ⚠ Failed to delete: {secret}{Colors.ENDC}")
@@ -3532,7 +4051,7 @@ class TeardownRunner:
                     else:
                         print(f"{Colors.OKCYAN}  Skipping Secrets Manager cleanup{Colors.ENDC}")
             else:
-                print(f"{Colors.WARNING}  Could not list secrets: {result.stderr}{Colors.ENDC}")
+                print(f"{Colors.WARNING}  Could not list secrets: {error}{Colors.ENDC}")
         except Exception as e:
             print(f"{Colors.WARNING}  Error checking Secrets Manager: {e}{Colors.ENDC}")
 
@@ -3563,13 +4082,7 @@ class TeardownRunner:
             print(f"\n{Colors.OKCYAN}Teardown cancelled{Colors.ENDC}")
             return False
 
-        print(f"\n{Colors.RED}{Colors.BOLD}Starting teardown in 5 seconds... Press Ctrl+C to cancel{Colors.ENDC}")
-        import time
-        try:
-            for i in range(5, 0, -1):
-                print(f"{i}...")
-                time.sleep(1)
-        except KeyboardInterrupt:
+        if not _teardown_countdown():
             print(f"\n{Colors.OKCYAN}Teardown cancelled{Colors.ENDC}")
             return False
 
@@ -3577,8 +4090,13 @@ class TeardownRunner:
 
         # Execute teardown phases
         success = True
-        success = self.phase1_helm_releases() and success
-        success = self.phase2_kubernetes_resources() and success
+        self._kube.start()
+        try:
+            success = self.phase1_helm_releases() and success
+            success = self.phase2_kubernetes_resources() and success
+        finally:
+            # The cluster is gone after phase 3, so stop the proxy first
+            self._kube.stop()
         success = self.phase3_terraform_destroy() and success
         success = self.phase4_secrets_manager() and success
 
@@ -3612,162 +4130,190 @@ class TeardownRunner:
 class AKSTeardown:
     """Handles teardown of N8N AKS deployment"""
 
-    def __init__(self, script_dir: Path, config: AzureDeploymentConfig):
+    def __init__(self, script_dir: Path, config: AzureDeploymentConfig, keep_cluster: bool = False):
         self.script_dir = script_dir
         self.config = config
         self.terraform_dir = script_dir / "terraform" / "azure"
+        # Only remove n8n from the cluster; leave the cluster and Azure resources
+        self.keep_cluster = keep_cluster
+        # Probed once in phase 1 and reused by phase 2
+        self._cluster_reachable: Optional[bool] = None
+        self._kube = KubeProxy()
+
+    def _check_cluster(self) -> bool:
+        """Check once whether the cluster is reachable and reuse the answer"""
+        if self._cluster_reachable is None:
+            try:
+                if self._kube.url:
+                    self._cluster_reachable = self._kube.request('GET', '/readyz') == 200
+                else:
+                    self._cluster_reachable = _run_silent(['kubectl', 'cluster-info'], timeout=10).returncode == 0
+            except Exception:
+                self._cluster_reachable = False
+        return self._cluster_reachable
 
     def phase1_helm_releases(self) -> bool:
         """Phase 1: Uninstall Helm releases"""
         print(f"\n{Colors.HEADER}{Colors.BOLD}📦 PHASE 1: Uninstalling Helm Releases{Colors.ENDC}")
-        print("=" * 60)
+        print(_SEP)
 
         # Check if cluster is accessible
-        try:
-            result = subprocess.run(
-                ['kubectl', 'cluster-info'],
-                capture_output=True,
-                timeout=10
-            )
-            if result.returncode != 0:
-                print(f"{Colors.WARNING}⚠  Cluster not accessible, skipping Helm cleanup{Colors.ENDC}")
-                print(f"{Colors.WARNING}  If cluster still exists, manually uninstall: helm uninstall n8n -n {self.config.n8n_namespace}{Colors.ENDC}")
-                return True
-        except Exception as e:
-            print(f"{Colors.WARNING}⚠  Cannot verify cluster access: {e}{Colors.ENDC}")
+        if not self._check_cluster():
+            print(f"{Colors.WARNING}⚠  Cluster not accessible, skipping Helm cleanup{Colors.ENDC}")
+            print(f"{Colors.WARNING}  If cluster still exists, manually uninstall: helm uninstall n8n -n {self.config.n8n_namespace}{Colors.ENDC}")
             return True
 
         success = True
 
-        # Uninstall n8n
-        print(f"\n{Colors.OKCYAN}Checking for n8n Helm release...{Colors.ENDC}")
+        # Probe which releases are installed
+        candidates = [('n8n', self.config.n8n_namespace), ('ingress-nginx', 'ingress-nginx')]
+        print(f"\n{Colors.OKCYAN}Checking for {' and '.join(r for r, _ in candidates)} Helm releases...{Colors.ENDC}")
+        to_uninstall = []
         try:
-            result = subprocess.run(
-                ['helm', 'list', '-n', self.config.n8n_namespace, '-o', 'json'],
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
+            installed = self._installed_releases()
+            for release, namespace in candidates:
+                if (namespace, release) in installed:
+                    to_uninstall.append((release, namespace))
+                else:
+                    print(f"{Colors.OKCYAN}  {release} Helm release not found{Colors.ENDC}")
+        except Exception as e:
+            # e.g. Forbidden when listing across namespaces; the uninstalls are
+            # scoped to one namespace each, so just try them
+            print(f"{Colors.WARNING}  Could not list Helm releases ({e}); trying to uninstall each{Colors.ENDC}")
+            to_uninstall = list(candidates)
+
+        # Uninstall the releases found concurrently; each is a separate API wait
+        if to_uninstall:
+            for release, _ in to_uninstall:
+                print(f"{Colors.OKCYAN}  Uninstalling {release}...{Colors.ENDC}")
+            with ThreadPoolExecutor(max_workers=len(to_uninstall)) as executor:
+                futures = [executor.submit(self._helm_uninstall, release, namespace)
+                           for release, namespace in to_uninstall]
+                for future in as_completed(futures):
+                    release, returncode, stderr = future.result()
+                    if returncode == 0:
+                        print(f"{Colors.OKGREEN}  ✓ {release} uninstalled{Colors.ENDC}")
+                        if release == 'ingress-nginx':
+                            print(f"{Colors.OKCYAN}  Waiting for LoadBalancer to be deleted...{Colors.ENDC}")
+                            self._wait_lb_gone()
+                    elif 'not found' in stderr:
+                        print(f"{Colors.OKCYAN}  {release} Helm release not found{Colors.ENDC}")
+                    else:
+                        print(f"{Colors.FAIL}  ✗ Failed to uninstall {release}{Colors.ENDC}")
+                        print(f"  {stderr}")
+                        success = False
 
-            if result.returncode == 0:
-                releases = json.loads(result.stdout) if result.stdout.strip() else []
-                n8n_found = any(r.get('name') == 'n8n' for r in releases)
+        if success:
+            print(f"\n{Colors.OKGREEN}✓ Helm releases cleanup completed{Colors.ENDC}")
+        else:
+            print(f"\n{Colors.WARNING}⚠  Helm releases cleanup completed with warnings{Colors.ENDC}")
+
+        return success
+
+    @staticmethod
+    def _installed_releases() -> set:
+        """Return (namespace, release) pairs of all installed Helm releases
+
+        One `helm list -A` answers for every namespace instead of spawning
+        `helm list` per namespace, and runs with the same credentials as the
+        uninstalls that follow.
+        """
+        result = subprocess.run(
+            ['helm', 'list', '-A', '-o', 'json'],
+            capture_output=True,
+            text=True,
+            timeout=30
+        )
+        if result.returncode != 0:
+            raise RuntimeError(result.stderr.strip() or "helm list failed")
+        releases = _json_loads(result.stdout) if result.stdout.strip() else []
+        return {(r.get('namespace'), r.get('name')) for r in releases}
+
+    def _wait_lb_gone(self, namespace: str = 'ingress-nginx', svc: str = 'ingress-nginx-controller',
+                      timeout: int = 30) -> bool:
+        """Wait until the LoadBalancer Service is gone, at most `timeout` seconds
 
-                if n8n_found:
-                    print(f"{Colors.OKCYAN}  Uninstalling n8n...{Colors.ENDC}")
+        The Service keeps its load-balancer-cleanup finalizer until Azure has
+        removed the LoadBalancer, so its disappearance means the LB is gone.
+
+        Returns:
+            True if the Service disappeared within the timeout
+        """
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            try:
+                if self._kube.url:
+                    if self._kube.request('GET', f'/api/v1/namespaces/{namespace}/services/{svc}') == 404:
+                        return True
+                else:
                     result = subprocess.run(
-                        ['helm', 'uninstall', 'n8n', '-n', self.config.n8n_namespace],
+                        ['kubectl', 'get', 'svc', svc, '-n', namespace, '--ignore-not-found', '-o', 'name'],
                         capture_output=True,
                         text=True,
-                        timeout=60
+                        timeout=5
                     )
-                    if result.returncode == 0:
-                        print(f"{Colors.OKGREEN}  ✓ n8n uninstalled{Colors.ENDC}")
-                    else:
-                        print(f"{Colors.FAIL}  ✗ Failed to uninstall n8n{Colors.ENDC}")
-                        print(f"  {result.stderr}")
-                        success = False
-                else:
-                    print(f"{Colors.OKCYAN}  n8n Helm release not found{Colors.ENDC}")
-        except Exception as e:
-            print(f"{Colors.WARNING}  Error checking n8n release: {e}{Colors.ENDC}")
-            success = False
+                    if result.returncode == 0 and not result.stdout.strip():
+                        return True
+            except (subprocess.TimeoutExpired, OSError):
+                pass
+            time.sleep(2)
+        return False
+
+    @staticmethod
+    def _helm_uninstall(release: str, namespace: str) -> Tuple[str, int, str]:
+        """Uninstall a Helm release
 
-        # Uninstall ingress-nginx
-        print(f"\n{Colors.OKCYAN}Checking for ingress-nginx Helm release...{Colors.ENDC}")
+        Returns:
+            Tuple of (release, returncode, stderr)
+        """
         try:
             result = subprocess.run(
-                ['helm', 'list', '-n', 'ingress-nginx', '-o', 'json'],
+                ['helm', 'uninstall', release, '-n', namespace],
                 capture_output=True,
                 text=True,
-                timeout=30
+                timeout=60
             )
-
-            if result.returncode == 0:
-                releases = json.loads(result.stdout) if result.stdout.strip() else []
-                nginx_found = any(r.get('name') == 'ingress-nginx' for r in releases)
-
-                if nginx_found:
-                    print(f"{Colors.OKCYAN}  Uninstalling ingress-nginx...{Colors.ENDC}")
-                    result = subprocess.run(
-                        ['helm', 'uninstall', 'ingress-nginx', '-n', 'ingress-nginx'],
-                        capture_output=True,
-                        text=True,
-                        timeout=60
-                    )
-                    if result.returncode == 0:
-                        print(f"{Colors.OKGREEN}  ✓ ingress-nginx uninstalled{Colors.ENDC}")
-                        print(f"{Colors.OKCYAN}  Waiting for LoadBalancer to be deleted...{Colors.ENDC}")
-                        import time
-                        time.sleep(30)
-                    else:
-                        print(f"{Colors.FAIL}  ✗ Failed to uninstall ingress-nginx{Colors.ENDC}")
-                        print(f"  {result.stderr}")
-                        success = False
-                else:
-                    print(f"{Colors.OKCYAN}  ingress-nginx Helm release not found{Colors.ENDC}")
+            return release, result.returncode, result.stderr
         except Exception as e:
-            print(f"{Colors.WARNING}  Error checking ingress-nginx release: {e}{Colors.ENDC}")
-            success = False
-
-        if success:
-            print(f"\n{Colors.OKGREEN}✓ Helm releases cleanup completed{Colors.ENDC}")
-        else:
-            print(f"\n{Colors.WARNING}⚠  Helm releases cleanup completed with warnings{Colors.ENDC}")
-
-        return success
+            return release, 1, str(e)
 
     def phase2_kubernetes_resources(self) -> bool:
         """Phase 2: Remove Kubernetes resources"""
         print(f"\n{Colors.HEADER}{Colors.BOLD}☸️  PHASE 2: Removing Kubernetes Resources{Colors.ENDC}")
-        print("=" * 60)
+        print(_SEP)
 
-        # Check cluster access
-        try:
-            result = subprocess.run(['kubectl', 'cluster-info'], capture_output=True, timeout=10)
-            if result.returncode != 0:
-                print(f"{Colors.WARNING}⚠  Cluster not accessible, skipping Kubernetes cleanup{Colors.ENDC}")
-                return True
-        except Exception:
+        # Check cluster access (already answered by phase 1)
+        if not self._check_cluster():
             print(f"{Colors.WARNING}⚠  Cluster not accessible, skipping Kubernetes cleanup{Colors.ENDC}")
             return True
 
         success = True
 
-        # Delete namespace (this will delete all resources in it)
-        print(f"\n{Colors.OKCYAN}Deleting namespace {self.config.n8n_namespace}...{Colors.ENDC}")
+        # Delete both namespaces (and everything in them) in one call; --wait=false
+        # returns once the deletions are accepted, the apiserver finishes them
+        namespaces = [self.config.n8n_namespace, 'ingress-nginx']
+        print(f"\n{Colors.OKCYAN}Deleting namespaces {', '.join(namespaces)}...{Colors.ENDC}")
         try:
             result = subprocess.run(
-                ['kubectl', 'delete', 'namespace', self.config.n8n_namespace, '--ignore-not-found=true'],
+                ['kubectl', 'delete', 'namespace', *namespaces, '--ignore-not-found=true', '--wait=false',
+                 '--cascade=background'],
                 capture_output=True,
                 text=True,
-                timeout=120
+                timeout=60
             )
-            if result.returncode == 0:
-                print(f"{Colors.OKGREEN}  ✓ Namespace {self.config.n8n_namespace} deleted{Colors.ENDC}")
-            else:
-                print(f"{Colors.WARNING}  ⚠  Failed to delete namespace: {result.stderr}{Colors.ENDC}")
-                success = False
+            # kubectl prints one `namespace "X" deleted` line per deleted namespace
+            deleted = {line.split('"')[1] for line in result.stdout.splitlines() if line.count('"') >= 2}
+            for namespace in namespaces:
+                if result.returncode == 0 or namespace in deleted:
+                    print(f"{Colors.OKGREEN}  ✓ Namespace {namespace} deleted{Colors.ENDC}")
+                else:
+                    print(f"{Colors.WARNING}  ⚠  Failed to delete namespace {namespace}: {result.stderr}{Colors.ENDC}")
+                    if namespace == self.config.n8n_namespace:
+                        success = False
         except Exception as e:
-            print(f"{Colors.WARNING}  ⚠  Error deleting namespace: {e}{Colors.ENDC}")
+            print(f"{Colors.WARNING}  ⚠  Error deleting namespaces: {e}{Colors.ENDC}")
             success = False
 
-        # Delete ingress-nginx namespace
-        print(f"\n{Colors.OKCYAN}Deleting namespace ingress-nginx...{Colors.ENDC}")
-        try:
-            result = subprocess.run(
-                ['kubectl', 'delete', 'namespace', 'ingress-nginx', '--ignore-not-found=true'],
-                capture_output=True,
-                text=True,
-                timeout=120
-            )
-            if result.returncode == 0:
-                print(f"{Colors.OKGREEN}  ✓ Namespace ingress-nginx deleted{Colors.ENDC}")
-            else:
-                print(f"{Colors.WARNING}  ⚠  Failed to delete namespace: {result.stderr}{Colors.ENDC}")
-        except Exception as e:
-            print(f"{Colors.WARNING}  ⚠  Error deleting namespace: {e}{Colors.ENDC}")
-
         if success:
             print(f"\n{Colors.OKGREEN}✓ Kubernetes resources cleanup completed{Colors.ENDC}")
         else:
@@ -3778,7 +4324,7 @@ class AKSTeardown:
     def phase3_terraform_destroy(self) -> bool:
         """Phase 3: Destroy Azure infrastructure"""
         print(f"\n{Colors.HEADER}{Colors.BOLD}🏗️  PHASE 3: Destroying Azure Infrastructure{Colors.ENDC}")
-        print("=" * 60)
+        print(_SEP)
 
         if not self.terraform_dir.exists():
             print(f"{Colors.WARNING}⚠  Terraform directory not found: {self.terraform_dir}{Colors.ENDC}")
@@ -3788,12 +4334,41 @@ class AKSTeardown:
         print(f"\n{Colors.HEADER}Running Terraform destroy...{Colors.ENDC}")
         print(f"{Colors.WARNING}This will delete all Azure infrastructure resources{Colors.ENDC}\n")
 
-        result = subprocess.run(
+        # Stream output line by line so a Ctrl+C can stop terraform cleanly
+        proc = subprocess.Popen(
             ['terraform', 'destroy', '-auto-approve'],
-            cwd=self.terraform_dir
+            cwd=self.terraform_dir,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1
         )
+        try:
+            for line in proc.stdout:
+                print(line, end='')
+            proc.wait()
+        except KeyboardInterrupt:
+            # terraform got the SIGINT too and is finishing its in-flight
+            # operations. Another signal now would make it abort mid-destroy, so
+            # only escalate if it hasn't stopped on its own. Keep draining its
+            # output meanwhile so it can't block on a full pipe.
+            print(f"\n{Colors.WARNING}Interrupted, waiting for terraform to stop...{Colors.ENDC}")
+            threading.Thread(
+                target=lambda: [print(line, end='') for line in proc.stdout],
+                daemon=True
+            ).start()
+            try:
+                proc.wait(timeout=120)
+            except subprocess.TimeoutExpired:
+                proc.terminate()
+                try:
+                    proc.wait(timeout=30)
+                except subprocess.TimeoutExpired:
+                    proc.kill()
+                    proc.wait()
+            raise
 
-        if result.returncode == 0:
+        if proc.returncode == 0:
             print(f"\n{Colors.OKGREEN}✓ Azure infrastructure destroyed{Colors.ENDC}")
             return True
         else:
@@ -3801,31 +4376,45 @@ class AKSTeardown:
             print(f"{Colors.WARNING}You may need to manually destroy resources in Azure Portal{Colors.ENDC}")
             return False
 
+    def _list_deleted_vaults(self) -> List[str]:
+        """List the names of soft-deleted Key Vaults in the subscription
+
+        Uses the Azure SDK when installed (no az CLI start-up cost), otherwise
+        `az keyvault list-deleted`.
+        """
+        client = _kv_client(self.config.azure_subscription_id) if self.config.azure_subscription_id else None
+        if client is not None:
+            return [vault.name for vault in client.vaults.list_deleted()]
+
+        result = subprocess.run(
+            ['az', 'keyvault', 'list-deleted', '--query', '[].name', '-o', 'tsv'],
+            capture_output=True,
+            text=True,
+            timeout=30
+        )
+        if result.returncode == 0 and result.stdout.strip():
+            return result.stdout.strip().split('\n')
+        return []
+
     def phase4_keyvault_cleanup(self) -> bool:
         """Phase 4: Clean up Azure Key Vault soft-deleted items"""
         print(f"\n{Colors.HEADER}{Colors.BOLD}🔑 PHASE 4: Key Vault Cleanup{Colors.ENDC}")
-        print("=" * 60)
+        print(_SEP)
 
         # Azure Key Vault has soft-delete enabled by default
         # We may need to purge soft-deleted vaults
         print(f"\n{Colors.OKCYAN}Checking for soft-deleted Key Vaults...{Colors.ENDC}")
 
         try:
-            # List soft-deleted vaults
-            result = subprocess.run(
-                ['az', 'keyvault', 'list-deleted', '--query', '[].name', '-o', 'tsv'],
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
+            deleted_vaults = self._list_deleted_vaults()
 
-            if result.returncode == 0 and result.stdout.strip():
-                deleted_vaults = result.stdout.strip().split('\n')
+            if deleted_vaults:
                 print(f"{Colors.OKCYAN}  Found {len(deleted_vaults)} soft-deleted Key Vault(s){Colors.ENDC}")
 
                 # Check if any match our resource group pattern
+                needle = self.config.resource_group_name.replace('-', '')
                 for vault_name in deleted_vaults:
-                    if self.config.resource_group_name.replace('-', '') in vault_name:
+                    if needle in vault_name:
                         print(f"\n{Colors.WARNING}⚠  Soft-deleted Key Vault found: {vault_name}{Colors.ENDC}")
                         print(f"{Colors.WARNING}  To permanently delete, run:{Colors.ENDC}")
                         print(f"  {Colors.OKCYAN}az keyvault purge --name {vault_name}{Colors.ENDC}")
@@ -3840,19 +4429,33 @@ class AKSTeardown:
 
     def execute(self) -> bool:
         """Execute full teardown with confirmation"""
-        # Display warning banner
+        # Display warning banner listing only what this mode deletes
+        if self.keep_cluster:
+            doomed = [
+                "  This will PERMANENTLY DELETE from the AKS cluster:",
+                "  • n8n (Helm release, namespace and its volumes)",
+                "  • ingress-nginx and its Azure load balancer",
+                "",
+                "  The AKS cluster and Azure resources are kept.",
+            ]
+        else:
+            doomed = [
+                "  This will PERMANENTLY DELETE all resources including:",
+                "  • Kubernetes applications (n8n, ingress-nginx)",
+                "  • AKS cluster and node pools",
+                "  • PostgreSQL Flexible Server (if exists)",
+                "  • VNet, subnets, NAT gateways, Public IPs",
+                "  • Azure Key Vault and secrets",
+                "  • Network Security Groups",
+            ]
+
         print(f"\n{Colors.RED}{Colors.BOLD}")
         print("╔" + "═" * 58 + "╗")
         print("║" + " " * 58 + "║")
         print("║" + "     N8N AKS DEPLOYMENT TEARDOWN".center(58) + "║")
         print("║" + " " * 58 + "║")
-        print("║" + "  This will PERMANENTLY DELETE all resources including:".ljust(59) + "║")
-        print("║" + "  • Kubernetes applications (n8n, ingress-nginx)".ljust(59) + "║")
-        print("║" + "  • AKS cluster and node pools".ljust(59) + "║")
-        print("║" + "  • PostgreSQL Flexible Server (if exists)".ljust(59) + "║")
-        print("║" + "  • VNet, subnets, NAT gateways, Public IPs".ljust(59) + "║")
-        print("║" + "  • Azure Key Vault and secrets".ljust(59) + "║")
-        print("║" + "  • Network Security Groups".ljust(59) + "║")
+        for line in doomed:
+            print("║" + line.ljust(59 if line else 58) + "║")
         print("║" + " " * 58 + "║")
         print("║" + "  ⚠️  THIS CANNOT BE UNDONE! ⚠️".center(62) + "║")
         print("║" + " " * 58 + "║")
@@ -3864,24 +4467,29 @@ class AKSTeardown:
             print(f"\n{Colors.OKCYAN}Teardown cancelled{Colors.ENDC}")
             return False
 
-        print(f"\n{Colors.RED}{Colors.BOLD}Starting teardown in 5 seconds... Press Ctrl+C to cancel{Colors.ENDC}")
-        import time
-        try:
-            for i in range(5, 0, -1):
-                print(f"{i}...")
-                time.sleep(1)
-        except KeyboardInterrupt:
+        if not _teardown_countdown():
             print(f"\n{Colors.OKCYAN}Teardown cancelled{Colors.ENDC}")
             return False
 
         start_time = time.time()
 
-        # Execute teardown phases
+        # Execute teardown phases. These stay sequential: the Key Vault that
+        # phase 4 looks for only becomes soft-deleted once phase 3's destroy has
+        # removed it. Phase 2 only matters when the cluster outlives the
+        # teardown; otherwise phase 3 takes the namespaces down with it.
         success = True
-        success = self.phase1_helm_releases() and success
-        success = self.phase2_kubernetes_resources() and success
-        success = self.phase3_terraform_destroy() and success
-        success = self.phase4_keyvault_cleanup() and success
+        self._kube.start()
+        try:
+            success = self.phase1_helm_releases() and success
+            if self.keep_cluster:
+                success = self.phase2_kubernetes_resources() and success
+        finally:
+            # The cluster is gone after phase 3, so stop the proxy first
+            self._kube.stop()
+        if not self.keep_cluster:
+            print(f"\n{Colors.OKCYAN}Skipping Phase 2 - Phase 3 destroys the cluster and its namespaces{Colors.ENDC}")
+            success = self.phase3_terraform_destroy() and success
+            success = self.phase4_keyvault_cleanup() and success
 
         end_time = time.time()
         duration = int(end_time - start_time)
@@ -3911,7 +4519,7 @@ class AKSTeardown:
 # Azure Deployment Functions
 ########################################
 
-def deploy_azure_terraform(config: AzureDeploymentConfig, terraform_dir: Path) -> bool:
+def deploy_azure_terraform(config: AzureDeploymentConfig, terraform_dir: Path) -> Tuple[bool, Dict[str, str]]:
     """Deploy Azure infrastructure with Terraform
 
     Args:
@@ -3919,10 +4527,11 @@ def deploy_azure_terraform(config: AzureDeploymentConfig, terraform_dir: Path) -
         terraform_dir: Path to Azure Terraform directory
 
     Returns:
-        bool: True if deployment succeeded
+        Tuple of (success, terraform outputs) - outputs are read once after
+        apply so the Helm phase doesn't have to query Terraform again
     """
     print(f"\n{Colors.HEADER}{Colors.BOLD}🏗️  PHASE 1: Terraform Infrastructure Deployment{Colors.ENDC}")
-    print("=" * 60)
+    print(_SEP)
 
     # Initialize Terraform using TerraformRunner
     tf_runner = TerraformRunner(terraform_dir)
@@ -3931,30 +4540,31 @@ def deploy_azure_terraform(config: AzureDeploymentConfig, terraform_dir: Path) -
     print(f"\n{Colors.HEADER}Initializing Terraform...{Colors.ENDC}")
     if not tf_runner.init():
         print(f"{Colors.FAIL}✗ Terraform init failed{Colors.ENDC}")
-        return False
+        return False, {}
 
     # Plan
     print(f"\n{Colors.HEADER}Planning infrastructure...{Colors.ENDC}")
-    success, output = tf_runner.plan(display_output=False)
+    success, output = tf_runner.plan(display_output=False, lock=False, refresh=False)
     if not success:
         print(f"{Colors.FAIL}✗ Terraform plan failed{Colors.ENDC}")
         print(output)
-        return False
+        return False, {}
 
     # Show plan summary
     print(f"{Colors.OKGREEN}✓ Terraform plan completed{Colors.ENDC}")
     print(f"\n{Colors.BOLD}Plan Summary:{Colors.ENDC}")
-    print("=" * 60)
+    print(_SEP)
     print(output)
-    print("=" * 60)
+    print(_SEP)
+    _print_unrefreshed_plan_notice()
 
     # Save current state before applying (to preserve previous location's state)
     print(f"\n{Colors.HEADER}💾 Saving current state before deployment...{Colors.ENDC}")
     tfstate_path = terraform_dir / "terraform.tfstate"
     if tfstate_path.exists():
         try:
-            with open(tfstate_path, 'r') as f:
-                existing_state = json.load(f)
+            with open(tfstate_path, 'rb') as f:
+                existing_state = _json_loads(f.read())
                 if existing_state.get('resources'):
                     # Try to detect location from existing state
                     existing_location = None
@@ -3984,13 +4594,19 @@ def deploy_azure_terraform(config: AzureDeploymentConfig, terraform_dir: Path) -
 
     if not tf_runner.apply():
         print(f"{Colors.FAIL}✗ Terraform apply failed{Colors.ENDC}")
-        return False
+        return False, {}
 
     print(f"{Colors.OKGREEN}✓ Azure infrastructure deployed{Colors.ENDC}")
 
-    # Save newly created state with location name
-    print(f"\n{Colors.HEADER}💾 Saving state for location {config.azure_location}...{Colors.ENDC}")
-    save_state_for_region(terraform_dir, config.azure_location)
+    # Read the outputs while the new state is backed up; both only read tfstate
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        outputs_future = executor.submit(tf_runner.get_outputs)
+
+        # Save newly created state with location name
+        print(f"\n{Colors.HEADER}💾 Saving state for location {config.azure_location}...{Colors.ENDC}")
+        save_state_for_region(terraform_dir, config.azure_location)
+
+        outputs = outputs_future.result()
 
     # Get kubeconfig
     print(f"\n{Colors.HEADER}Configuring kubectl...{Colors.ENDC}")
@@ -4006,16 +4622,16 @@ def deploy_azure_terraform(config: AzureDeploymentConfig, terraform_dir: Path) -
     else:
         print(f"{Colors.FAIL}✗ Failed to configure kubectl{Colors.ENDC}")
         print(result.stderr)
-        return False
+        return False, {}
 
     # Verify cluster access
-    result = subprocess.run(['kubectl', 'cluster-info'], capture_output=True, text=True, timeout=30)
+    result = _run_silent(['kubectl', 'cluster-info'])
     if result.returncode == 0:
         print(f"{Colors.OKGREEN}✓ Cluster accessible{Colors.ENDC}")
     else:
         print(f"{Colors.WARNING}⚠  Cluster info check failed, but continuing...{Colors.ENDC}")
 
-    return True
+    return True, outputs
 
 
 def deploy_gcp_terraform(config: GCPDeploymentConfig, terraform_dir: Path) -> bool:
@@ -4029,7 +4645,7 @@ def deploy_gcp_terraform(config: GCPDeploymentConfig, terraform_dir: Path) -> bo
         bool: True if deployment succeeded
     """
     print(f"\n{Colors.HEADER}{Colors.BOLD}🏗️  PHASE 1: Terraform Infrastructure Deployment{Colors.ENDC}")
-    print("=" * 60)
+    print(_SEP)
 
     # Initialize Terraform using TerraformRunner
     tf_runner = TerraformRunner(terraform_dir)
@@ -4042,14 +4658,14 @@ def deploy_gcp_terraform(config: GCPDeploymentConfig, terraform_dir: Path) -> bo
 
     # Plan
     print(f"\n{Colors.HEADER}Planning infrastructure...{Colors.ENDC}")
-    success, output = tf_runner.plan(display_output=False)
+    success, output = tf_runner.plan(display_output=False, lock=False, refresh=False)
     if not success:
         print(f"{Colors.FAIL}✗ Terraform plan failed{Colors.ENDC}")
         print(output)
 
         # Check for common GCP authentication errors and provide helpful guidance
         if "application default credentials" in output.lower() or "adc" in output.lower():
-            print(f"\n{Colors.WARNING}{'=' * 60}{Colors.ENDC}")
+            print(f"\n{Colors.WARNING}{_SEP}{Colors.ENDC}")
             print(f"{Colors.WARNING}{Colors.BOLD}⚠️  GCP AUTHENTICATION ERROR{Colors.ENDC}")
             print(f"\n{Colors.BOLD}To fix this, run:{Colors.ENDC}")
             print(f"  {Colors.OKCYAN}gcloud auth application-default login{Colors.ENDC}")
@@ -4057,11 +4673,11 @@ def deploy_gcp_terraform(config: GCPDeploymentConfig, terraform_dir: Path) -> bo
             print(f"  • {Colors.OKCYAN}gcloud auth login{Colors.ENDC} - Authenticates YOU for gcloud CLI commands")
             print(f"  • {Colors.OKCYAN}gcloud auth application-default login{Colors.ENDC} - Authenticates Terraform and other tools")
             print(f"\n{Colors.BOLD}Both commands are required for full GCP functionality.{Colors.ENDC}")
-            print(f"{Colors.WARNING}{'=' * 60}{Colors.ENDC}\n")
+            print(f"{Colors.WARNING}{_SEP}{Colors.ENDC}\n")
 
         # Check for API not enabled errors
         elif "googleapi: error 403" in output.lower() or "api has not been enabled" in output.lower():
-            print(f"\n{Colors.WARNING}{'=' * 60}{Colors.ENDC}")
+            print(f"\n{Colors.WARNING}{_SEP}{Colors.ENDC}")
             print(f"{Colors.WARNING}{Colors.BOLD}⚠️  GCP API NOT ENABLED{Colors.ENDC}")
             print(f"\n{Colors.BOLD}One or more required GCP APIs are not enabled.{Colors.ENDC}")
             print(f"\n{Colors.BOLD}To fix this, enable the required APIs:{Colors.ENDC}")
@@ -4072,11 +4688,11 @@ def deploy_gcp_terraform(config: GCPDeploymentConfig, terraform_dir: Path) -> bo
             print(f"  {Colors.OKCYAN}gcloud services enable sqladmin.googleapis.com{Colors.ENDC}")
             print(f"\n{Colors.BOLD}Or enable all at once:{Colors.ENDC}")
             print(f"  {Colors.OKCYAN}gcloud services enable container.googleapis.com compute.googleapis.com servicenetworking.googleapis.com secretmanager.googleapis.com sqladmin.googleapis.com --project={config.gcp_project_id}{Colors.ENDC}")
-            print(f"{Colors.WARNING}{'=' * 60}{Colors.ENDC}\n")
+            print(f"{Colors.WARNING}{_SEP}{Colors.ENDC}\n")
 
         # Check for quota errors
         elif "quota" in output.lower() and ("exceeded" in output.lower() or "limit" in output.lower()):
-            print(f"\n{Colors.WARNING}{'=' * 60}{Colors.ENDC}")
+            print(f"\n{Colors.WARNING}{_SEP}{Colors.ENDC}")
             print(f"{Colors.WARNING}{Colors.BOLD}⚠️  GCP QUOTA EXCEEDED{Colors.ENDC}")
             print(f"\n{Colors.BOLD}Your GCP project has exceeded resource quotas.{Colors.ENDC}")
             print(f"\n{Colors.BOLD}Possible solutions:{Colors.ENDC}")
@@ -4086,24 +4702,25 @@ def deploy_gcp_terraform(config: GCPDeploymentConfig, terraform_dir: Path) -> bo
             print(f"     {Colors.OKCYAN}https://console.cloud.google.com/iam-admin/quotas{Colors.ENDC}")
             print(f"  3. Try a different region with available capacity")
             print(f"  4. Clean up unused resources in your project")
-            print(f"{Colors.WARNING}{'=' * 60}{Colors.ENDC}\n")
+            print(f"{Colors.WARNING}{_SEP}{Colors.ENDC}\n")
 
         return False
 
     # Show plan summary
     print(f"{Colors.OKGREEN}✓ Terraform plan completed{Colors.ENDC}")
     print(f"\n{Colors.BOLD}Plan Summary:{Colors.ENDC}")
-    print("=" * 60)
+    print(_SEP)
     print(output)
-    print("=" * 60)
+    print(_SEP)
+    _print_unrefreshed_plan_notice()
 
     # Save current state before applying (to preserve previous region's state)
     print(f"\n{Colors.HEADER}💾 Saving current state before deployment...{Colors.ENDC}")
     tfstate_path = terraform_dir / "terraform.tfstate"
     if tfstate_path.exists():
         try:
-            with open(tfstate_path, 'r') as f:
-                existing_state = json.load(f)
+            with open(tfstate_path, 'rb') as f:
+                existing_state = _json_loads(f.read())
                 if existing_state.get('resources'):
                     # Try to detect region from existing state
                     existing_region = None
@@ -4158,7 +4775,7 @@ def deploy_gcp_terraform(config: GCPDeploymentConfig, terraform_dir: Path) -> bo
         return False
 
     # Verify cluster access
-    result = subprocess.run(['kubectl', 'cluster-info'], capture_output=True, text=True, timeout=30)
+    result = _run_silent(['kubectl', 'cluster-info'])
     if result.returncode == 0:
         print(f"{Colors.OKGREEN}✓ Cluster accessible{Colors.ENDC}")
     else:
@@ -4179,7 +4796,7 @@ def deploy_gcp_helm(config: GCPDeploymentConfig, charts_dir: Path, encryption_ke
         bool: True if deployment succeeded
     """
     print(f"\n{Colors.HEADER}{Colors.BOLD}🚀 PHASE 2: Helm Application Deployment{Colors.ENDC}")
-    print("=" * 60)
+    print(_SEP)
 
     # Create namespace and service account with workload identity
     print(f"\n{Colors.HEADER}Setting up Kubernetes namespace and workload identity...{Colors.ENDC}")
@@ -4349,9 +4966,9 @@ metadata:
             time.sleep(10)
 
     # Show access information
-    print(f"\n{Colors.OKGREEN}{Colors.BOLD}{'=' * 60}{Colors.ENDC}")
+    print(f"\n{Colors.OKGREEN}{Colors.BOLD}{_SEP}{Colors.ENDC}")
     print(f"{Colors.OKGREEN}{Colors.BOLD}  ✅ N8N DEPLOYMENT COMPLETE!{Colors.ENDC}")
-    print(f"{Colors.OKGREEN}{Colors.BOLD}{'=' * 60}{Colors.ENDC}")
+    print(f"{Colors.OKGREEN}{Colors.BOLD}{_SEP}{Colors.ENDC}")
 
     if loadbalancer_ip:
         print(f"\n{Colors.BOLD}Access Information:{Colors.ENDC}")
@@ -4374,19 +4991,22 @@ metadata:
     return True
 
 
-def deploy_azure_helm(config: AzureDeploymentConfig, charts_dir: Path, encryption_key: str) -> bool:
+def deploy_azure_helm(config: AzureDeploymentConfig, charts_dir: Path, encryption_key: str,
+                      outputs: Optional[Dict[str, str]] = None) -> bool:
     """Deploy n8n to Azure AKS via Helm
 
     Args:
         config: Azure deployment configuration
         charts_dir: Path to Helm charts directory
         encryption_key: n8n encryption key
+        outputs: Terraform outputs from deploy_azure_terraform (read from
+            Terraform when not given)
 
     Returns:
         bool: True if deployment succeeded
     """
     print(f"\n{Colors.HEADER}{Colors.BOLD}🚀 PHASE 2: Helm Application Deployment{Colors.ENDC}")
-    print("=" * 60)
+    print(_SEP)
 
     # Get LoadBalancer IP from Azure (if available from Terraform outputs)
     print(f"\n{Colors.HEADER}Checking for LoadBalancer IP...{Colors.ENDC}")
@@ -4394,9 +5014,9 @@ def deploy_azure_helm(config: AzureDeploymentConfig, charts_dir: Path, encryptio
 
     # Try to get from terraform outputs first
     try:
-        terraform_dir = charts_dir.parent / "terraform" / "azure"
-        tf_runner = TerraformRunner(terraform_dir)
-        outputs = tf_runner.get_outputs()
+        if outputs is None:
+            terraform_dir = charts_dir.parent / "terraform" / "azure"
+            outputs = TerraformRunner(terraform_dir).get_outputs()
         loadbalancer_ip = outputs.get('loadbalancer_ip', None)
         if loadbalancer_ip:
             print(f"{Colors.OKGREEN}✓ LoadBalancer IP from Terraform: {loadbalancer_ip}{Colors.ENDC}")
@@ -4420,7 +5040,18 @@ def deploy_azure_helm(config: AzureDeploymentConfig, charts_dir: Path, encryptio
         'env.TZ': config.timezone,
     }
 
-    # Build helm command
+    # Nest the dotted keys into one values tree. JSON is valid YAML, so Helm
+    # reads it as a values file and parses it once instead of once per flag.
+    nested_values: Dict[str, Any] = {}
+    for key, value in helm_values.items():
+        *parents, leaf = key.split('.')
+        node = nested_values
+        for part in parents:
+            node = node.setdefault(part, {})
+        node[leaf] = value
+
+    # Build helm command (the encryption key stays on the command line so it
+    # is never written to disk)
     helm_cmd = [
         'helm', 'upgrade', '--install', 'n8n',
         str(charts_dir / 'n8n'),
@@ -4429,19 +5060,24 @@ def deploy_azure_helm(config: AzureDeploymentConfig, charts_dir: Path, encryptio
         '--set-string', f'envSecrets.N8N_ENCRYPTION_KEY={encryption_key}'
     ]
 
-    # Add other values
-    for key, value in helm_values.items():
-        helm_cmd.extend(['--set-string', f'{key}={value}'])
-
     # Check if values-azure.yaml exists
     values_azure = charts_dir / 'n8n' / 'values-azure.yaml'
     if values_azure.exists():
         helm_cmd.extend(['--values', str(values_azure)])
         print(f"{Colors.OKCYAN}  Using values-azure.yaml{Colors.ENDC}")
 
+    # Later --values files win, so the generated values keep overriding
+    # values-azure.yaml as the per-key --set-string flags used to
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as values_file:
+        json.dump(nested_values, values_file)
+    helm_cmd.extend(['--values', values_file.name])
+
     # Deploy
     print(f"\n{Colors.HEADER}Deploying n8n via Helm...{Colors.ENDC}")
-    result = subprocess.run(helm_cmd, capture_output=True, text=True, timeout=600)
+    try:
+        result = subprocess.run(helm_cmd, capture_output=True, text=True, timeout=600)
+    finally:
+        os.unlink(values_file.name)
 
     if result.returncode != 0:
         print(f"{Colors.FAIL}✗ Helm deployment failed{Colors.ENDC}")
@@ -4450,25 +5086,30 @@ def deploy_azure_helm(config: AzureDeploymentConfig, charts_dir: Path, encryptio
 
     print(f"{Colors.OKGREEN}✓ n8n deployed to Azure AKS{Colors.ENDC}")
 
-    # Wait for deployment to be ready
+    # Wait for deployment to be ready. Waiting on the Deployment's Available
+    # condition is a single watch on one object, and unlike a pod label
+    # selector it doesn't fail fast when the ReplicaSet hasn't created pods yet.
     print(f"\n{Colors.HEADER}Waiting for n8n pods to be ready...{Colors.ENDC}")
-    result = subprocess.run([
-        'kubectl', 'wait', '--for=condition=ready',
-        'pod', '-l', 'app.kubernetes.io/name=n8n',
-        '-n', config.n8n_namespace,
-        '--timeout=300s'
-    ], capture_output=True, text=True)
+    try:
+        ready = _run_silent([
+            'kubectl', 'wait', '--for=condition=available',
+            'deployment/n8n',
+            '-n', config.n8n_namespace,
+            '--timeout=300s'
+        ], timeout=310).returncode == 0
+    except subprocess.TimeoutExpired:
+        ready = False
 
-    if result.returncode == 0:
+    if ready:
         print(f"{Colors.OKGREEN}✓ n8n pods are ready{Colors.ENDC}")
     else:
         print(f"{Colors.WARNING}⚠  Pod readiness check timed out, check manually with:{Colors.ENDC}")
         print(f"  {Colors.OKCYAN}kubectl get pods -n {config.n8n_namespace}{Colors.ENDC}")
 
     # Show access information
-    print(f"\n{Colors.OKGREEN}{Colors.BOLD}{'=' * 60}{Colors.ENDC}")
+    print(f"\n{Colors.OKGREEN}{Colors.BOLD}{_SEP}{Colors.ENDC}")
     print(f"{Colors.OKGREEN}{Colors.BOLD}  ✅ N8N DEPLOYMENT COMPLETE!{Colors.ENDC}")
-    print(f"{Colors.OKGREEN}{Colors.BOLD}{'=' * 60}{Colors.ENDC}")
+    print(f"{Colors.OKGREEN}{Colors.BOLD}{_SEP}{Colors.ENDC}")
 
     if loadbalancer_ip:
         print(f"\n{Colors.BOLD}Access Information:{Colors.ENDC}")
@@ -4498,6 +5139,8 @@ def main():
                        help='Skip Terraform infrastructure deployment and start from application deployment (assumes infrastructure already exists)')
     parser.add_argument('--teardown', action='store_true',
                        help='Teardown and destroy all n8n deployment resources')
+    parser.add_argument('--keep-cluster', action='store_true',
+                       help='With --teardown on Azure: remove n8n from the AKS cluster but keep the cluster and its Azure resources')
     parser.add_argument('--restore-region', type=str, metavar='REGION',
                        help='''Restore terraform state for a specific AWS region or Azure location before running operations.
 
@@ -4540,9 +5183,9 @@ WORKFLOW:
     if not cloud_provider:
         # Prompt user to select cloud provider
         print(f"{Colors.BOLD}{Colors.HEADER}")
-        print("=" * 60)
+        print(_SEP)
         print("  N8N Multi-Cloud Deployment Setup")
-        print("=" * 60)
+        print(_SEP)
         print(Colors.ENDC)
 
         print(f"\n{Colors.HEADER}Select Cloud Provider:{Colors.ENDC}\n")
@@ -4559,6 +5202,10 @@ WORKFLOW:
         else:
             cloud_provider = "gcp"
 
+    if args.keep_cluster and not (args.teardown and cloud_provider == "azure"):
+        print(f"{Colors.FAIL}✗ --keep-cluster is only supported with --teardown on Azure{Colors.ENDC}")
+        sys.exit(1)
+
     # Display banner with selected provider
     if cloud_provider == "aws":
         provider_name = "AWS EKS"
@@ -4567,9 +5214,9 @@ WORKFLOW:
     else:
         provider_name = "GCP GKE"
     print(f"\n{Colors.BOLD}{Colors.HEADER}")
-    print("=" * 60)
+    print(_SEP)
     print(f"  N8N {provider_name} Deployment Setup")
-    print("=" * 60)
+    print(_SEP)
     print(Colors.ENDC)
 
     try:
@@ -4585,7 +5232,7 @@ WORKFLOW:
             else:
                 region_type = "region" if cloud_provider == "aws" else "location"
             print(f"\n{Colors.HEADER}🔄 Restoring Terraform state for {region_type}: {args.restore_region}{Colors.ENDC}")
-            print("=" * 60)
+            print(_SEP)
 
             # Determine terraform directory based on cloud provider
             if cloud_provider == "azure":
@@ -4628,27 +5275,25 @@ WORKFLOW:
                 tfvars_path = script_dir / "terraform" / "azure" / "terraform.tfvars"
                 if tfvars_path.exists():
                     try:
-                        content = tfvars_path.read_text()
-                        for line in content.split('\n'):
-                            if 'resource_group_name' in line and '=' in line:
-                                config.resource_group_name = line.split('=')[1].strip().strip('"')
-                            elif 'cluster_name' in line and '=' in line:
-                                config.cluster_name = line.split('=')[1].strip().strip('"')
-                            elif 'n8n_namespace' in line and '=' in line:
-                                config.n8n_namespace = line.split('=')[1].strip().strip('"')
+                        tfvars = dict(_TFVARS_RE.findall(tfvars_path.read_text()))
+                        for key in ('resource_group_name', 'cluster_name', 'n8n_namespace', 'azure_subscription_id'):
+                            if key in tfvars:
+                                setattr(config, key, tfvars[key])
                         print(f"{Colors.OKGREEN}✓ Loaded Azure configuration{Colors.ENDC}")
                     except Exception as e:
                         print(f"{Colors.WARNING}⚠  Could not load Azure config: {e}{Colors.ENDC}")
 
                 # Show detected configuration
-                print(f"\n{Colors.HEADER}Azure AKS Teardown Configuration:{Colors.ENDC}")
-                print("=" * 60)
-                print(f"Resource Group:  {Colors.OKCYAN}{config.resource_group_name}{Colors.ENDC}")
-                print(f"Cluster:         {Colors.OKCYAN}{config.cluster_name}{Colors.ENDC}")
-                print(f"Namespace:       {Colors.OKCYAN}{config.n8n_namespace}{Colors.ENDC}")
-                print("=" * 60)
-
-                teardown = AKSTeardown(script_dir, config)
+                print("\n".join([
+                    f"\n{Colors.HEADER}Azure AKS Teardown Configuration:{Colors.ENDC}",
+                    _SEP,
+                    f"Resource Group:  {Colors.OKCYAN}{config.resource_group_name}{Colors.ENDC}",
+                    f"Cluster:         {Colors.OKCYAN}{config.cluster_name}{Colors.ENDC}",
+                    f"Namespace:       {Colors.OKCYAN}{config.n8n_namespace}{Colors.ENDC}",
+                    _SEP,
+                ]))
+
+                teardown = AKSTeardown(script_dir, config, keep_cluster=args.keep_cluster)
                 success = teardown.execute()
                 sys.exit(0 if success else 1)
 
@@ -4660,28 +5305,24 @@ WORKFLOW:
                 tfvars_path = script_dir / "terraform" / "gcp" / "terraform.tfvars"
                 if tfvars_path.exists():
                     try:
-                        content = tfvars_path.read_text()
-                        for line in content.split('\n'):
-                            if 'gcp_project_id' in line and '=' in line:
-                                config.gcp_project_id = line.split('=')[1].strip().strip('"')
-                            elif 'gcp_region' in line and '=' in line:
-                                config.gcp_region = line.split('=')[1].strip().strip('"')
-                            elif 'cluster_name' in line and '=' in line:
-                                config.cluster_name = line.split('=')[1].strip().strip('"')
-                            elif 'n8n_namespace' in line and '=' in line:
-                                config.n8n_namespace = line.split('=')[1].strip().strip('"')
+                        tfvars = dict(_TFVARS_RE.findall(tfvars_path.read_text()))
+                        for key in ('gcp_project_id', 'gcp_region', 'cluster_name', 'n8n_namespace'):
+                            if key in tfvars:
+                                setattr(config, key, tfvars[key])
                         print(f"{Colors.OKGREEN}✓ Loaded GCP configuration{Colors.ENDC}")
                     except Exception as e:
                         print(f"{Colors.WARNING}⚠  Could not load GCP config: {e}{Colors.ENDC}")
 
                 # Show detected configuration
-                print(f"\n{Colors.HEADER}GCP GKE Teardown Configuration:{Colors.ENDC}")
-                print("=" * 60)
-                print(f"Project ID:      {Colors.OKCYAN}{config.gcp_project_id}{Colors.ENDC}")
-                print(f"Region:          {Colors.OKCYAN}{config.gcp_region}{Colors.ENDC}")
-                print(f"Cluster:         {Colors.OKCYAN}{config.cluster_name}{Colors.ENDC}")
-                print(f"Namespace:       {Colors.OKCYAN}{config.n8n_namespace}{Colors.ENDC}")
-                print("=" * 60)
+                print("\n".join([
+                    f"\n{Colors.HEADER}GCP GKE Teardown Configuration:{Colors.ENDC}",
+                    _SEP,
+                    f"Project ID:      {Colors.OKCYAN}{config.gcp_project_id}{Colors.ENDC}",
+                    f"Region:          {Colors.OKCYAN}{config.gcp_region}{Colors.ENDC}",
+                    f"Cluster:         {Colors.OKCYAN}{config.cluster_name}{Colors.ENDC}",
+                    f"Namespace:       {Colors.OKCYAN}{config.n8n_namespace}{Colors.ENDC}",
+                    _SEP,
+                ]))
 
                 # Confirm teardown
                 prompt = ConfigurationPrompt()
@@ -4713,7 +5354,6 @@ WORKFLOW:
 
                     # Give time for connections to close
                     print(f"{Colors.OKCYAN}  Waiting for database connections to close...{Colors.ENDC}")
-                    import time
                     time.sleep(10)
 
                 except Exception as e:
@@ -4753,56 +5393,30 @@ WORKFLOW:
                 tfvars_path = script_dir / "terraform" / "aws" / "terraform.tfvars"
                 if tfvars_path.exists():
                     try:
-                        content = tfvars_path.read_text()
-                        for line in content.split('\n'):
-                            if 'aws_profile' in line and '=' in line:
-                                config.aws_profile = line.split('=')[1].strip().strip('"')
-                            elif 'region' in line and '=' in line:
-                                config.aws_region = line.split('=')[1].strip().strip('"')
-                                detected_sources.append("terraform.tfvars")
-                            elif 'n8n_namespace' in line and '=' in line:
-                                config.n8n_namespace = line.split('=')[1].strip().strip('"')
+                        tfvars = dict(_TFVARS_RE.findall(tfvars_path.read_text()))
+                        if 'aws_profile' in tfvars:
+                            config.aws_profile = tfvars['aws_profile']
+                        if 'region' in tfvars:
+                            config.aws_region = tfvars['region']
+                            detected_sources.append("terraform.tfvars")
+                        if 'n8n_namespace' in tfvars:
+                            config.n8n_namespace = tfvars['n8n_namespace']
                     except Exception:
                         pass
 
                 # Try terraform.tfstate
                 if not config.aws_region:
-                    tfstate_path = script_dir / "terraform" / "aws" / "terraform.tfstate"
-                    if tfstate_path.exists():
-                        try:
-                            result = subprocess.run(
-                                ['terraform', '-chdir=' + str(script_dir / "terraform" / "aws"), 'output', '-json'],
-                                capture_output=True,
-                                text=True,
-                                timeout=30
-                            )
-                            if result.returncode == 0:
-                                outputs = json.loads(result.stdout)
-                                if 'region' in outputs:
-                                    config.aws_region = outputs['region'].get('value', '')
-                                    detected_sources.append("terraform state")
-                        except Exception:
-                            pass
+                    region = _region_from_tfstate(script_dir / "terraform" / "aws" / "terraform.tfstate")
+                    if region:
+                        config.aws_region = region
+                        detected_sources.append("terraform state")
 
                 # Try to get from kubectl context (if cluster is accessible)
                 if not config.aws_region:
-                    try:
-                        result = subprocess.run(
-                            ['kubectl', 'config', 'current-context'],
-                            capture_output=True,
-                            text=True,
-                            timeout=5
-                        )
-                        if result.returncode == 0 and 'eks' in result.stdout:
-                            # Extract region from EKS context (format: arn:aws:eks:REGION:...)
-                            context = result.stdout.strip()
-                            if 'eks' in context:
-                                parts = context.split(':')
-                                if len(parts) > 3:
-                                    config.aws_region = parts[3]
-                                    detected_sources.append("kubectl context")
-                    except Exception:
-                        pass
+                    region = _region_from_kube_context()
+                    if region:
+                        config.aws_region = region
+                        detected_sources.append("kubectl context")
 
                 # Show what we found
                 if config.aws_region:
@@ -4865,12 +5479,14 @@ WORKFLOW:
                     sys.exit(1)
 
             # Show final configuration summary
-            print(f"\n{Colors.HEADER}{Colors.BOLD}Teardown Configuration{Colors.ENDC}")
-            print("=" * 60)
-            print(f"AWS Profile:     {Colors.OKCYAN}{config.aws_profile}{Colors.ENDC}")
-            print(f"AWS Region:      {Colors.OKCYAN}{config.aws_region}{Colors.ENDC}")
-            print(f"Namespace:       {Colors.OKCYAN}{config.n8n_namespace}{Colors.ENDC}")
-            print("=" * 60)
+            print("\n".join([
+                f"\n{Colors.HEADER}{Colors.BOLD}Teardown Configuration{Colors.ENDC}",
+                _SEP,
+                f"AWS Profile:     {Colors.OKCYAN}{config.aws_profile}{Colors.ENDC}",
+                f"AWS Region:      {Colors.OKCYAN}{config.aws_region}{Colors.ENDC}",
+                f"Namespace:       {Colors.OKCYAN}{config.n8n_namespace}{Colors.ENDC}",
+                _SEP,
+            ]))
 
             teardown = TeardownRunner(script_dir, config)
             success = teardown.run()
@@ -4888,16 +5504,8 @@ WORKFLOW:
             tf_runner = TerraformRunner(script_dir / "terraform" / cloud_provider)
             outputs = tf_runner.get_outputs()
 
-            if outputs and 'configure_kubectl' in outputs:
-                print(f"\n{Colors.HEADER}🔧 Configuring kubectl...{Colors.ENDC}")
-                kubectl_cmd = outputs['configure_kubectl']
-                result = subprocess.run(kubectl_cmd, shell=True, capture_output=True, text=True)
-
-                if result.returncode == 0:
-                    print(f"{Colors.OKGREEN}✓ kubectl configured{Colors.ENDC}")
-                else:
-                    print(f"{Colors.WARNING}⚠  kubectl configuration failed. Run manually:{Colors.ENDC}")
-                    print(f"  {Colors.OKCYAN}{kubectl_cmd}{Colors.ENDC}")
+            if outputs:
+                _configure_kubectl(outputs)
 
             loadbalancer_url = get_loadbalancer_url(max_attempts=30, delay=10)
             if not loadbalancer_url:
@@ -4944,17 +5552,8 @@ WORKFLOW:
             print(f"{Colors.OKGREEN}✓ Retrieved Terraform outputs{Colors.ENDC}")
 
             # Configure kubectl if needed
-            if 'configure_kubectl' in outputs:
-                print(f"\n{Colors.HEADER}🔧 Configuring kubectl...{Colors.ENDC}")
-                kubectl_cmd = outputs['configure_kubectl']
-                result = subprocess.run(kubectl_cmd, shell=True, capture_output=True, text=True)
-
-                if result.returncode == 0:
-                    print(f"{Colors.OKGREEN}✓ kubectl configured{Colors.ENDC}")
-                else:
-                    print(f"{Colors.WARNING}⚠  kubectl configuration failed. Run manually:{Colors.ENDC}")
-                    print(f"  {Colors.OKCYAN}{kubectl_cmd}{Colors.ENDC}")
-                    raise Exception("kubectl configuration required")
+            if not _configure_kubectl(outputs):
+                raise Exception("kubectl configuration required")
 
             # Verify and switch kubectl context to target cluster
             print(f"\n{Colors.HEADER}🔍 Verifying kubectl context...{Colors.ENDC}")
@@ -5034,21 +5633,24 @@ WORKFLOW:
 
                 # Deploy Azure infrastructure via Terraform
                 terraform_dir = script_dir / "terraform" / "azure"
-                if not deploy_azure_terraform(config, terraform_dir):
+                deployed, tf_outputs = deploy_azure_terraform(config, terraform_dir)
+                if not deployed:
                     raise Exception("Azure infrastructure deployment failed")
 
                 # Deploy n8n application via Helm
                 charts_dir = script_dir / "charts"
-                if not deploy_azure_helm(config, charts_dir, config.n8n_encryption_key):
+                if not deploy_azure_helm(config, charts_dir, config.n8n_encryption_key, tf_outputs):
                     raise Exception("Azure n8n deployment failed")
 
-                print(f"\n{Colors.BOLD}Useful Commands:{Colors.ENDC}")
-                print(f"  {Colors.OKCYAN}kubectl get pods -n {config.n8n_namespace}{Colors.ENDC}")
-                print(f"  {Colors.OKCYAN}kubectl get ingress -n {config.n8n_namespace}{Colors.ENDC}")
-                print(f"  {Colors.OKCYAN}kubectl logs -f deployment/n8n -n {config.n8n_namespace}{Colors.ENDC}")
-                print(f"  {Colors.OKCYAN}kubectl get svc -n ingress-nginx{Colors.ENDC}")
-
-                print("\n" + "=" * 60)
+                print("\n".join([
+                    f"\n{Colors.BOLD}Useful Commands:{Colors.ENDC}",
+                    f"  {Colors.OKCYAN}kubectl get pods -n {config.n8n_namespace}{Colors.ENDC}",
+                    f"  {Colors.OKCYAN}kubectl get ingress -n {config.n8n_namespace}{Colors.ENDC}",
+                    f"  {Colors.OKCYAN}kubectl logs -f deployment/n8n -n {config.n8n_namespace}{Colors.ENDC}",
+                    f"  {Colors.OKCYAN}kubectl get svc -n ingress-nginx{Colors.ENDC}",
+                    "",
+                    _SEP,
+                ]))
 
             elif cloud_provider == "gcp":
                 # ═══════════════════════════════════════════════════════════════
@@ -5077,14 +5679,15 @@ WORKFLOW:
                 if not deploy_gcp_helm(config, charts_dir, config.n8n_encryption_key):
                     raise Exception("GCP n8n deployment failed")
 
-                print(f"\n{Colors.BOLD}Useful Commands:{Colors.ENDC}")
-                print(f"  {Colors.OKCYAN}kubectl get pods -n {config.n8n_namespace}{Colors.ENDC}")
-                print(f"  {Colors.OKCYAN}kubectl get svc -n {config.n8n_namespace}{Colors.ENDC}")
-                print(f"  {Colors.OKCYAN}kubectl logs -f deployment/n8n -n {config.n8n_namespace}{Colors.ENDC}")
+                lines = [
+                    f"\n{Colors.BOLD}Useful Commands:{Colors.ENDC}",
+                    f"  {Colors.OKCYAN}kubectl get pods -n {config.n8n_namespace}{Colors.ENDC}",
+                    f"  {Colors.OKCYAN}kubectl get svc -n {config.n8n_namespace}{Colors.ENDC}",
+                    f"  {Colors.OKCYAN}kubectl logs -f deployment/n8n -n {config.n8n_namespace}{Colors.ENDC}",
+                ]
                 if config.database_type == 'cloudsql':
-                    print(f"  {Colors.OKCYAN}kubectl describe pod -n {config.n8n_namespace} -l app.kubernetes.io/name=n8n{Colors.ENDC}")
-
-                print("\n" + "=" * 60)
+                    lines.append(f"  {Colors.OKCYAN}kubectl describe pod -n {config.n8n_namespace} -l app.kubernetes.io/name=n8n{Colors.ENDC}")
+                print("\n".join(lines + ["", _SEP]))
 
             else:
                 # ═══════════════════════════════════════════════════════════════
@@ -5107,7 +5710,7 @@ WORKFLOW:
                 # PHASE 1: Deploy Infrastructure (Terraform)
                 # ═══════════════════════════════════════════════════════════════
                 print(f"\n{Colors.HEADER}{Colors.BOLD}📦 PHASE 1: Deploying Infrastructure{Colors.ENDC}")
-                print("=" * 60)
+                print(_SEP)
                 print("This will create:")
                 print("  • VPC, subnets, NAT gateways (~5 minutes)")
                 print("  • EKS cluster and node group (~15-20 minutes)")
@@ -5121,7 +5724,9 @@ WORKFLOW:
                     raise Exception("Terraform initialization failed")
 
                 # Run plan and display summary
-                plan_success, plan_output = tf_runner.plan(display_output=True)
+                # Refresh this plan: after a region switch or state restore the
+                # local state may not match what actually exists
+                plan_success, plan_output = tf_runner.plan(display_output=True, lock=False)
                 if not plan_success:
                     raise Exception("Terraform plan failed")
 
@@ -5133,31 +5738,20 @@ WORKFLOW:
                 # Save current state before applying (to preserve previous region's state)
                 print(f"\n{Colors.HEADER}💾 Saving current state before deployment...{Colors.ENDC}")
                 tfstate_path = script_dir / "terraform" / "aws" / "terraform.tfstate"
-                if tfstate_path.exists():
+                tfstate_stat = _safe_stat(tfstate_path)
+                if tfstate_stat is not None:
                     try:
-                        with open(tfstate_path, 'r') as f:
-                            existing_state = json.load(f)
-                            if existing_state.get('resources'):
-                                # Try to detect region from existing state
-                                existing_region = None
-                                for resource in existing_state.get('resources', []):
-                                    if resource.get('type') == 'aws_eks_cluster':
-                                        instances = resource.get('instances', [])
-                                        if instances:
-                                            arn = instances[0].get('attributes', {}).get('arn', '')
-                                            if arn:
-                                                # ARN format: arn:aws:eks:REGION:...
-                                                existing_region = arn.split(':')[3] if len(arn.split(':')) > 3 else None
-                                                break
-
-                                if existing_region:
-                                    save_state_for_region(script_dir / "terraform" / "aws", existing_region)
-                                else:
-                                    print(f"{Colors.OKCYAN}  Could not detect region from existing state, using timestamp backup{Colors.ENDC}")
-                                    timestamp = int(time.time())
-                                    backup_path = script_dir / "terraform" / "aws" / f"terraform.tfstate.{timestamp}.backup"
-                                    shutil.copy2(tfstate_path, backup_path)
-                                    print(f"{Colors.OKGREEN}✓ Saved current state to {backup_path.name}{Colors.ENDC}")
+                        # Try to detect region from existing state
+                        has_resources, existing_region = _scan_tfstate(tfstate_path, tfstate_stat)
+                        if has_resources:
+                            if existing_region:
+                                save_state_for_region(script_dir / "terraform" / "aws", existing_region)
+                            else:
+                                print(f"{Colors.OKCYAN}  Could not detect region from existing state, using timestamp backup{Colors.ENDC}")
+                                timestamp = int(time.time())
+                                backup_path = script_dir / "terraform" / "aws" / f"terraform.tfstate.{timestamp}.backup"
+                                shutil.copy2(tfstate_path, backup_path)
+                                print(f"{Colors.OKGREEN}✓ Saved current state to {backup_path.name}{Colors.ENDC}")
                     except Exception as e:
                         print(f"{Colors.WARNING}⚠  Could not save existing state: {e}{Colors.ENDC}")
 
@@ -5166,31 +5760,26 @@ WORKFLOW:
 
                 print(f"\n{Colors.OKGREEN}✓ Infrastructure deployed successfully{Colors.ENDC}")
 
-                # Save newly created state with region name
-                print(f"\n{Colors.HEADER}💾 Saving state for region {config.aws_region}...{Colors.ENDC}")
-                save_state_for_region(script_dir / "terraform" / "aws", config.aws_region)
+                # Read the outputs while the new state is backed up; both only
+                # read tfstate
+                with ThreadPoolExecutor(max_workers=1) as executor:
+                    outputs_future = executor.submit(tf_runner.get_outputs)
 
-                # Get outputs
-                outputs = tf_runner.get_outputs()
+                    # Save newly created state with region name
+                    print(f"\n{Colors.HEADER}💾 Saving state for region {config.aws_region}...{Colors.ENDC}")
+                    save_state_for_region(script_dir / "terraform" / "aws", config.aws_region)
 
-                # Configure kubectl
-                if 'configure_kubectl' in outputs:
-                    print(f"\n{Colors.HEADER}🔧 Configuring kubectl...{Colors.ENDC}")
-                    kubectl_cmd = outputs['configure_kubectl']
-                    result = subprocess.run(kubectl_cmd, shell=True, capture_output=True, text=True)
+                    outputs = outputs_future.result()
 
-                    if result.returncode == 0:
-                        print(f"{Colors.OKGREEN}✓ kubectl configured{Colors.ENDC}")
-                    else:
-                        print(f"{Colors.WARNING}⚠  kubectl configuration failed. Run manually:{Colors.ENDC}")
-                        print(f"  {Colors.OKCYAN}{kubectl_cmd}{Colors.ENDC}")
-                        raise Exception("kubectl configuration required")
+                # Configure kubectl
+                if not _configure_kubectl(outputs):
+                    raise Exception("kubectl configuration required")
 
         # ═══════════════════════════════════════════════════════════════
         # PHASE 2: Deploy n8n Application (Helm)
         # ═══════════════════════════════════════════════════════════════
         print(f"\n{Colors.HEADER}{Colors.BOLD}🚀 PHASE 2: Deploying n8n Application{Colors.ENDC}")
-        print("=" * 60)
+        print(_SEP)
 
         helm_runner = HelmRunner(script_dir / "charts" / "n8n")
 
@@ -5229,7 +5818,7 @@ WORKFLOW:
         # PHASE 3: Get LoadBalancer URL
         # ═══════════════════════════════════════════════════════════════
         print(f"\n{Colors.HEADER}{Colors.BOLD}🌐 PHASE 3: Retrieving LoadBalancer URL{Colors.ENDC}")
-        print("=" * 60)
+        print(_SEP)
 
         loadbalancer_url = get_loadbalancer_url(max_attempts=30, delay=10)
 
@@ -5242,9 +5831,9 @@ WORKFLOW:
         # ═══════════════════════════════════════════════════════════════
         # DEPLOYMENT COMPLETE - Show Access Information
         # ═══════════════════════════════════════════════════════════════
-        print(f"\n{Colors.OKGREEN}{Colors.BOLD}{'=' * 60}{Colors.ENDC}")
+        print(f"\n{Colors.OKGREEN}{Colors.BOLD}{_SEP}{Colors.ENDC}")
         print(f"{Colors.OKGREEN}{Colors.BOLD}  🎉 N8N DEPLOYMENT COMPLETE!{Colors.ENDC}")
-        print(f"{Colors.OKGREEN}{Colors.BOLD}{'=' * 60}{Colors.ENDC}\n")
+        print(f"{Colors.OKGREEN}{Colors.BOLD}{_SEP}{Colors.ENDC}\n")
 
         print(f"{Colors.BOLD}Your n8n instance is now running!{Colors.ENDC}\n")
         print(f"LoadBalancer URL: {Colors.OKCYAN}{loadbalancer_url}{Colors.ENDC}")
@@ -5261,17 +5850,17 @@ WORKFLOW:
             # Then configure Basic Auth
             configure_basic_auth_interactive(config, script_dir, config.n8n_namespace)
 
-        # Show useful kubectl commands
-        print(f"\n{Colors.BOLD}Useful Commands:{Colors.ENDC}")
-        print(f"  {Colors.OKCYAN}kubectl get pods -n {config.n8n_namespace}{Colors.ENDC}")
-        print(f"  {Colors.OKCYAN}kubectl get ingress -n {config.n8n_namespace}{Colors.ENDC}")
-        print(f"  {Colors.OKCYAN}kubectl logs -f deployment/n8n -n {config.n8n_namespace}{Colors.ENDC}")
-        print(f"  {Colors.OKCYAN}kubectl get svc -n ingress-nginx{Colors.ENDC}")
-
+        # Show useful kubectl commands, written as one block
+        lines = [
+            f"\n{Colors.BOLD}Useful Commands:{Colors.ENDC}",
+            f"  {Colors.OKCYAN}kubectl get pods -n {config.n8n_namespace}{Colors.ENDC}",
+            f"  {Colors.OKCYAN}kubectl get ingress -n {config.n8n_namespace}{Colors.ENDC}",
+            f"  {Colors.OKCYAN}kubectl logs -f deployment/n8n -n {config.n8n_namespace}{Colors.ENDC}",
+            f"  {Colors.OKCYAN}kubectl get svc -n ingress-nginx{Colors.ENDC}",
+        ]
         if config.tls_certificate_source in ["byo", "letsencrypt"]:
-            print(f"  {Colors.OKCYAN}kubectl get certificate -n {config.n8n_namespace}{Colors.ENDC}")
-
-        print("\n" + "=" * 60)
+            lines.append(f"  {Colors.OKCYAN}kubectl get certificate -n {config.n8n_namespace}{Colors.ENDC}")
+        print("\n".join(lines + ["", _SEP]))
 
         # Cleanup backup on success (only if updater was created)
         if 'updater' in locals():
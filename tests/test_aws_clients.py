@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the optional boto3 client factories
+
+Tests cover:
+- _aws_client falls back to None (AWS CLI path) when boto3 is not installed,
+  including when botocore is installed on its own
+"""
+
+import unittest
+import sys
+import types
+from unittest.mock import patch
+from pathlib import Path
+
+# Add parent directory to path to import setup.py modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import setup
+
+
+class TestAWSClientFallback(unittest.TestCase):
+    """Test _aws_client without boto3"""
+
+    def setUp(self):
+        """Start and end every test with empty factory caches"""
+        for factory in (setup._aws_config, setup._aws_session, setup._aws_client):
+            factory.cache_clear()
+            self.addCleanup(factory.cache_clear)
+
+    def test_botocore_without_boto3(self):
+        """Test _aws_client returns None when only botocore is installed"""
+        botocore = types.ModuleType('botocore')
+        botocore_config = types.ModuleType('botocore.config')
+        botocore_config.Config = lambda **kwargs: object()
+        botocore.config = botocore_config
+
+        # A None entry in sys.modules makes the import raise ImportError
+        with patch.dict(sys.modules, {
+            'boto3': None,
+            'botocore': botocore,
+            'botocore.config': botocore_config,
+        }):
+            self.assertIsNone(setup._aws_config())
+            self.assertIsNone(setup._aws_client('rds', None, 'us-east-1'))
+
+    def test_no_aws_sdk(self):
+        """Test _aws_client returns None when neither boto3 nor botocore is installed"""
+        with patch.dict(sys.modules, {'boto3': None, 'botocore': None, 'botocore.config': None}):
+            self.assertIsNone(setup._aws_client('secretsmanager', None, 'us-east-1'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -10,16 +10,29 @@ Tests cover:
 - ConfigurationPrompt GCP configuration collection (mocked)
 
 Target: 90%+ code coverage for Phase 1 components
+
+Running:
+    pytest tests/test_gcp_phase1.py
+    pytest -n auto tests/test_gcp_phase1.py   # parallel, needs pytest-xdist
+
+On a clean checkout, run `python -m compileall -q setup.py` before a parallel
+run so the workers load setup.py's cached bytecode instead of each compiling it.
+
+Every test is independent: subprocess, shutil.which and input are mocked,
+patchers are started per class, and file writes go to private temporary
+directories, so xdist may spread tests across workers without grouping.
 """
 
 import unittest
+import contextlib
+import copy
+import io
 import json
 import subprocess
 from unittest.mock import Mock, patch, MagicMock, mock_open
 from pathlib import Path
 import sys
 import tempfile
-import shutil
 
 # Add parent directory to path to import setup.py modules
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -33,6 +46,87 @@ from setup import (
     SetupInterrupted
 )
 
+# Default config built once; every field is a str/int/bool, so a shallow copy is independent
+_DEFAULT_GCP_CONFIG = GCPDeploymentConfig()
+
+
+def _fresh_config():
+    """Return a default GCPDeploymentConfig without re-running __init__"""
+    return copy.copy(_DEFAULT_GCP_CONFIG)
+
+
+# gcloud JSON payloads, serialized once at import
+_PROJECTS_JSON = json.dumps([
+    {"projectId": "project-1", "name": "Test Project 1"},
+    {"projectId": "project-2", "name": "Test Project 2"}
+])
+_PROJECT_NO_NAME_JSON = json.dumps([
+    {"projectId": "project-3"}
+])
+_ACTIVE_ACCOUNT_JSON = json.dumps([{
+    "account": "user@example.com",
+    "status": "ACTIVE"
+}])
+_PROJECT_DESCRIBE_JSON = json.dumps({
+    "projectId": "test-project",
+    "name": "Test Project"
+})
+
+# APIs check_required_apis expects to be enabled
+_REQUIRED_APIS = frozenset({
+    "compute.googleapis.com",
+    "container.googleapis.com",
+    "cloudresourcemanager.googleapis.com",
+    "iam.googleapis.com",
+    "iamcredentials.googleapis.com",
+    "secretmanager.googleapis.com",
+    "sqladmin.googleapis.com",
+    "servicenetworking.googleapis.com",
+    "logging.googleapis.com",
+    "monitoring.googleapis.com",
+})
+_SOME_APIS = frozenset({"compute.googleapis.com", "container.googleapis.com"})
+_ALL_APIS_JSON = json.dumps([{"config": {"name": name}} for name in sorted(_REQUIRED_APIS)])
+_SOME_APIS_JSON = json.dumps([{"config": {"name": name}} for name in sorted(_SOME_APIS)])
+
+# Version-check results keyed by tool, shared by the DependencyChecker tests
+_SUBPROCESS_RESPONSES = {
+    'terraform': Mock(returncode=0, stdout="Terraform v1.6.0"),
+    'helm': Mock(returncode=0, stdout="v3.10.0"),
+    'kubectl': Mock(returncode=0, stdout="Client Version: v1.25.0"),
+    'openssl': Mock(returncode=0, stdout="OpenSSL 1.1.1"),
+    'gcloud': Mock(returncode=0, stdout="Google Cloud SDK 450.0.0"),
+}
+_MISS = Mock(returncode=1)
+
+
+def _fake_run(*args, **kwargs):
+    """subprocess.run stand-in answering version checks from _SUBPROCESS_RESPONSES"""
+    cmd = args[0]
+    for tool, response in _SUBPROCESS_RESPONSES.items():
+        if tool in cmd:
+            return response
+    return _MISS
+
+
+# Answers to collect_gcp_configuration's prompts for a single-project SQLite setup.
+# A tuple, so variants can splice it (e.g. _BASE_INPUTS[:8] + (...) + _BASE_INPUTS[8:])
+# without mutating the shared sequence.
+_BASE_INPUTS = (
+    "",  # region (default us-central1)
+    "",  # cluster name (default)
+    "3",  # machine type choice (3 = e2-medium, which is option index 2)
+    "",  # node count (default 1)
+    "",  # vpc name
+    "",  # subnet name
+    "",  # namespace
+    "n8n-gcp.example.com",  # hostname
+    "",  # timezone
+    "y",  # generate encryption key
+    "1",  # database type (SQLite)
+    "y"   # proceed
+)
+
 
 class TestGCPDeploymentConfig(unittest.TestCase):
     """Test GCPDeploymentConfig class"""
@@ -66,7 +160,7 @@ class TestGCPDeploymentConfig(unittest.TestCase):
 
     def test_to_dict(self):
         """Test GCPDeploymentConfig.to_dict() serialization"""
-        config = GCPDeploymentConfig()
+        config = _fresh_config()
         config.gcp_project_id = "test-project-123"
         config.gcp_region = "us-west1"
         config.gcp_zone = "us-west1-b"
@@ -88,7 +182,7 @@ class TestGCPDeploymentConfig(unittest.TestCase):
 
     def test_cloudsql_configuration(self):
         """Test GCPDeploymentConfig with Cloud SQL settings"""
-        config = GCPDeploymentConfig()
+        config = _fresh_config()
         config.database_type = "cloudsql"
         config.cloudsql_instance_name = "n8n-postgres-prod"
         config.cloudsql_tier = "db-n1-standard-1"
@@ -100,7 +194,7 @@ class TestGCPDeploymentConfig(unittest.TestCase):
 
     def test_tls_configuration(self):
         """Test GCPDeploymentConfig with TLS enabled"""
-        config = GCPDeploymentConfig()
+        config = _fresh_config()
         config.enable_tls = True
         config.n8n_protocol = "https"
         config.letsencrypt_email = "admin@example.com"
@@ -114,225 +208,148 @@ class TestGCPDeploymentConfig(unittest.TestCase):
 class TestGCPAuthChecker(unittest.TestCase):
     """Test GCPAuthChecker class"""
 
-    @patch('subprocess.run')
-    def test_list_projects_success(self, mock_run):
-        """Test list_projects returns project list successfully"""
-        mock_run.return_value = Mock(
-            returncode=0,
-            stdout=json.dumps([
-                {"projectId": "project-1", "name": "Test Project 1"},
-                {"projectId": "project-2", "name": "Test Project 2"}
-            ])
-        )
-
-        projects = GCPAuthChecker.list_projects()
-
-        self.assertEqual(len(projects), 2)
-        self.assertEqual(projects[0]['projectId'], "project-1")
-        self.assertEqual(projects[1]['name'], "Test Project 2")
-        mock_run.assert_called_once_with(
-            ['gcloud', 'projects', 'list', '--format=json'],
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
+    @classmethod
+    def setUpClass(cls):
+        """Patch subprocess.run once for the whole class"""
+        cls._run_patcher = patch('subprocess.run')
+        cls.mock_run = cls._run_patcher.start()
 
-    @patch('subprocess.run')
-    def test_list_projects_no_name(self, mock_run):
-        """Test list_projects handles projects without name field"""
-        mock_run.return_value = Mock(
-            returncode=0,
-            stdout=json.dumps([
-                {"projectId": "project-3"}
-            ])
-        )
+    @classmethod
+    def tearDownClass(cls):
+        cls._run_patcher.stop()
 
-        projects = GCPAuthChecker.list_projects()
-
-        self.assertEqual(len(projects), 1)
-        self.assertEqual(projects[0]['name'], "project-3")  # Falls back to projectId
-
-    @patch('subprocess.run')
-    def test_list_projects_error(self, mock_run):
-        """Test list_projects returns empty list on error"""
-        mock_run.return_value = Mock(returncode=1, stdout="")
-
-        projects = GCPAuthChecker.list_projects()
-
-        self.assertEqual(projects, [])
-
-    @patch('subprocess.run')
-    def test_list_projects_timeout(self, mock_run):
-        """Test list_projects handles timeout"""
-        mock_run.side_effect = subprocess.TimeoutExpired('gcloud', 30)
-
-        projects = GCPAuthChecker.list_projects()
-
-        self.assertEqual(projects, [])
-
-    @patch('subprocess.run')
-    def test_verify_credentials_success(self, mock_run):
-        """Test verify_credentials succeeds with valid credentials"""
-        # Mock gcloud auth list and project describe
-        mock_run.side_effect = [
-            Mock(
-                returncode=0,
-                stdout=json.dumps([{
-                    "account": "user@example.com",
-                    "status": "ACTIVE"
-                }])
-            ),
-            Mock(
-                returncode=0,
-                stdout=json.dumps({
-                    "projectId": "test-project",
-                    "name": "Test Project"
-                })
-            )
+    def setUp(self):
+        """Clear calls and canned results left by the previous test"""
+        self.mock_run.reset_mock(return_value=True, side_effect=True)
+
+    def test_list_projects(self):
+        """Test list_projects parses the gcloud project list, or returns [] on failure"""
+        cases = [
+            # (name, subprocess.run mock settings, expected projects)
+            ("success", dict(return_value=Mock(returncode=0, stdout=_PROJECTS_JSON)), [
+                {"projectId": "project-1", "name": "Test Project 1"},
+                {"projectId": "project-2", "name": "Test Project 2"}
+            ]),
+            # Projects without a name fall back to their projectId
+            ("no_name", dict(return_value=Mock(returncode=0, stdout=_PROJECT_NO_NAME_JSON)), [
+                {"projectId": "project-3", "name": "project-3"}
+            ]),
+            ("error", dict(return_value=Mock(returncode=1, stdout="")), []),
+            ("timeout", dict(side_effect=subprocess.TimeoutExpired('gcloud', 30)), []),
         ]
 
-        success, message = GCPAuthChecker.verify_credentials("test-project")
-
-        self.assertTrue(success)
-        self.assertIn("user@example.com", message)
-        self.assertIn("Test Project", message)
-
-    @patch('subprocess.run')
-    def test_verify_credentials_no_active_account(self, mock_run):
-        """Test verify_credentials fails when no active account"""
-        mock_run.return_value = Mock(
-            returncode=0,
-            stdout=json.dumps([])  # Empty list, no active accounts
-        )
-
-        success, message = GCPAuthChecker.verify_credentials("test-project")
-
-        self.assertFalse(success)
-        self.assertIn("No active gcloud", message)
-
-    @patch('subprocess.run')
-    def test_verify_credentials_project_not_found(self, mock_run):
-        """Test verify_credentials fails when project not accessible"""
-        mock_run.side_effect = [
-            Mock(
-                returncode=0,
-                stdout=json.dumps([{
-                    "account": "user@example.com",
-                    "status": "ACTIVE"
-                }])
-            ),
-            Mock(returncode=1, stderr="Project not found")
+        for name, mock_settings, expected in cases:
+            with self.subTest(name):
+                self.mock_run.reset_mock(return_value=True, side_effect=True)
+                self.mock_run.configure_mock(**mock_settings)
+
+                projects = GCPAuthChecker.list_projects()
+
+                self.assertEqual(projects, expected)
+                self.mock_run.assert_called_once_with(
+                    ['gcloud', 'projects', 'list', '--format=json'],
+                    capture_output=True,
+                    text=True,
+                    timeout=30
+                )
+
+    def test_verify_credentials(self):
+        """Test verify_credentials against auth list / project describe outcomes"""
+        active_account = Mock(returncode=0, stdout=_ACTIVE_ACCOUNT_JSON)
+        cases = [
+            # (name, gcloud responses in call order, expected success, message fragments)
+            ("success", [
+                active_account,
+                Mock(returncode=0, stdout=_PROJECT_DESCRIBE_JSON)
+            ], True, ("user@example.com", "Test Project")),
+            # Empty auth list, no active accounts
+            ("no_active_account", [
+                Mock(returncode=0, stdout=json.dumps([]))
+            ], False, ("No active gcloud",)),
+            ("project_not_found", [
+                active_account,
+                Mock(returncode=1, stderr="Project not found")
+            ], False, ("Cannot access project",)),
         ]
 
-        success, message = GCPAuthChecker.verify_credentials("test-project")
+        for name, responses, expected_success, fragments in cases:
+            with self.subTest(name):
+                self.mock_run.side_effect = responses
 
-        self.assertFalse(success)
-        self.assertIn("Cannot access project", message)
+                success, message = GCPAuthChecker.verify_credentials("test-project")
 
-    @patch('subprocess.run')
-    def test_check_required_apis_all_enabled(self, mock_run):
-        """Test check_required_apis when all APIs are enabled"""
-        enabled_apis = [
-            {"config": {"name": "compute.googleapis.com"}},
-            {"config": {"name": "container.googleapis.com"}},
-            {"config": {"name": "cloudresourcemanager.googleapis.com"}},
-            {"config": {"name": "iam.googleapis.com"}},
-            {"config": {"name": "iamcredentials.googleapis.com"}},
-            {"config": {"name": "secretmanager.googleapis.com"}},
-            {"config": {"name": "sqladmin.googleapis.com"}},
-            {"config": {"name": "servicenetworking.googleapis.com"}},
-            {"config": {"name": "logging.googleapis.com"}},
-            {"config": {"name": "monitoring.googleapis.com"}}
-        ]
+                self.assertEqual(success, expected_success)
+                for fragment in fragments:
+                    self.assertIn(fragment, message)
 
-        mock_run.return_value = Mock(
-            returncode=0,
-            stdout=json.dumps(enabled_apis)
-        )
+    def test_check_required_apis_all_enabled(self):
+        """Test check_required_apis when all APIs are enabled"""
+        self.mock_run.return_value = Mock(returncode=0, stdout=_ALL_APIS_JSON)
 
         apis_ok, missing = GCPAuthChecker.check_required_apis("test-project")
 
         self.assertTrue(apis_ok)
         self.assertEqual(missing, [])
 
-    @patch('subprocess.run')
-    def test_check_required_apis_some_missing(self, mock_run):
+    def test_check_required_apis_some_missing(self):
         """Test check_required_apis when some APIs are missing"""
-        enabled_apis = [
-            {"config": {"name": "compute.googleapis.com"}},
-            {"config": {"name": "container.googleapis.com"}}
-        ]
-
-        mock_run.return_value = Mock(
-            returncode=0,
-            stdout=json.dumps(enabled_apis)
-        )
+        self.mock_run.return_value = Mock(returncode=0, stdout=_SOME_APIS_JSON)
 
         apis_ok, missing = GCPAuthChecker.check_required_apis("test-project")
 
         self.assertFalse(apis_ok)
-        self.assertGreater(len(missing), 0)
-        self.assertIn("iam.googleapis.com", missing)
-        self.assertIn("secretmanager.googleapis.com", missing)
+        self.assertEqual(frozenset(missing), _REQUIRED_APIS - _SOME_APIS)
 
 
 class TestDependencyCheckerGCP(unittest.TestCase):
     """Test DependencyChecker with GCP support"""
 
-    @patch('subprocess.run')
-    @patch('shutil.which')
-    @patch('builtins.print')
-    def test_check_all_dependencies_gcp(self, mock_print, mock_which, mock_run):
+    @classmethod
+    def setUpClass(cls):
+        """Patch subprocess.run and shutil.which once for the whole class"""
+        cls._run_patcher = patch('subprocess.run')
+        cls._which_patcher = patch('shutil.which')
+        cls.mock_run = cls._run_patcher.start()
+        cls.mock_which = cls._which_patcher.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._which_patcher.stop()
+        cls._run_patcher.stop()
+
+    def setUp(self):
+        """Clear calls and canned results left by the previous test"""
+        self.mock_run.reset_mock(return_value=True, side_effect=True)
+        self.mock_which.reset_mock(return_value=True, side_effect=True)
+
+        # Silence the dependency report
+        self._stdout = sys.stdout
+        sys.stdout = io.StringIO()
+
+    def tearDown(self):
+        sys.stdout = self._stdout
+
+    def test_check_all_dependencies_gcp(self):
         """Test check_all_dependencies with cloud_provider='gcp'"""
         # Mock all tools as installed
-        mock_which.return_value = '/usr/bin/tool'
+        self.mock_which.return_value = '/usr/bin/tool'
 
         # Mock version checks
-        def mock_subprocess(*args, **kwargs):
-            cmd = args[0]
-            if 'terraform' in cmd:
-                return Mock(returncode=0, stdout="Terraform v1.6.0")
-            elif 'helm' in cmd:
-                return Mock(returncode=0, stdout="v3.10.0")
-            elif 'kubectl' in cmd:
-                return Mock(returncode=0, stdout="Client Version: v1.25.0")
-            elif 'openssl' in cmd:
-                return Mock(returncode=0, stdout="OpenSSL 1.1.1")
-            elif 'gcloud' in cmd:
-                return Mock(returncode=0, stdout="Google Cloud SDK 450.0.0")
-            return Mock(returncode=1)
-
-        mock_run.side_effect = mock_subprocess
+        self.mock_run.side_effect = _fake_run
 
         success, missing = DependencyChecker.check_all_dependencies(cloud_provider="gcp")
 
         self.assertTrue(success)
         self.assertEqual(missing, [])
 
-    @patch('subprocess.run')
-    @patch('shutil.which')
-    @patch('builtins.print')
-    def test_check_all_dependencies_gcp_missing_gcloud(self, mock_print, mock_which, mock_run):
+    def test_check_all_dependencies_gcp_missing_gcloud(self):
         """Test check_all_dependencies detects missing gcloud"""
         # Mock all tools except gcloud
         def mock_which_func(tool):
             return '/usr/bin/tool' if tool != 'gcloud' else None
 
-        mock_which.side_effect = mock_which_func
-
-        def mock_subprocess(*args, **kwargs):
-            cmd = args[0]
-            if 'terraform' in cmd:
-                return Mock(returncode=0, stdout="Terraform v1.6.0")
-            elif 'helm' in cmd:
-                return Mock(returncode=0, stdout="v3.10.0")
-            elif 'kubectl' in cmd:
-                return Mock(returncode=0, stdout="Client Version: v1.25.0")
-            elif 'openssl' in cmd:
-                return Mock(returncode=0, stdout="OpenSSL 1.1.1")
-            return Mock(returncode=1)
-
-        mock_run.side_effect = mock_subprocess
+        self.mock_which.side_effect = mock_which_func
+        self.mock_run.side_effect = _fake_run
 
         success, missing = DependencyChecker.check_all_dependencies(cloud_provider="gcp")
 
@@ -357,56 +374,55 @@ class TestDependencyCheckerGCP(unittest.TestCase):
 class TestConfigHistoryManagerGCP(unittest.TestCase):
     """Test ConfigHistoryManager with GCP configurations"""
 
-    def setUp(self):
-        """Create temporary directory for test files"""
-        self.temp_dir = Path(tempfile.mkdtemp())
-
-    def tearDown(self):
-        """Clean up temporary directory"""
-        if self.temp_dir.exists():
-            shutil.rmtree(self.temp_dir)
+    @classmethod
+    def setUpClass(cls):
+        """Save one GCP configuration, shared by the history and JSON file tests"""
+        cls._temp = tempfile.TemporaryDirectory()
+        cls.saved_dir = Path(cls._temp.name)
 
-    def test_save_gcp_configuration(self):
-        """Test saving GCP configuration to history"""
-        config = GCPDeploymentConfig()
+        config = _fresh_config()
         config.gcp_project_id = "test-project-456"
         config.gcp_region = "us-east1"
         config.cluster_name = "test-gke"
         config.n8n_encryption_key = "secret123"
+        config.database_type = "cloudsql"
+        config.cloudsql_instance_name = "test-db"
 
-        ConfigHistoryManager.save_configuration(config, "gcp", self.temp_dir)
+        ConfigHistoryManager.save_configuration(config, "gcp", cls.saved_dir)
 
+    @classmethod
+    def tearDownClass(cls):
+        cls._temp.cleanup()
+
+    def test_save_gcp_configuration(self):
+        """Test saving GCP configuration to history"""
         # Check history file was created
-        history_file = self.temp_dir / "setup_history.log"
+        history_file = self.saved_dir / "setup_history.log"
         self.assertTrue(history_file.exists())
 
         content = history_file.read_text()
-        self.assertIn("GCP", content)
-        self.assertIn("test-project-456", content)
-        self.assertIn("us-east1", content)
-        self.assertIn("test-gke", content)
-        # Encryption key should be redacted
-        self.assertIn("***REDACTED***", content)
+        expected = {
+            "**Cloud Provider:** GCP",
+            "- **gcp_project_id**: `test-project-456`",
+            "- **gcp_region**: `us-east1`",
+            "- **cluster_name**: `test-gke`",
+            # Encryption key should be redacted
+            "- **n8n_encryption_key**: `***REDACTED***`",
+        }
+        self.assertEqual(expected - set(content.splitlines()), set())
         self.assertNotIn("secret123", content)
 
     def test_save_gcp_configuration_json(self):
         """Test saving GCP configuration to JSON file"""
-        config = GCPDeploymentConfig()
-        config.gcp_project_id = "json-test-project"
-        config.database_type = "cloudsql"
-        config.cloudsql_instance_name = "test-db"
-
-        ConfigHistoryManager.save_configuration(config, "gcp", self.temp_dir)
-
         # Check JSON file was created
-        json_file = self.temp_dir / ".setup-current.json"
+        json_file = self.saved_dir / ".setup-current.json"
         self.assertTrue(json_file.exists())
 
         with open(json_file, 'r') as f:
             data = json.load(f)
 
         self.assertEqual(data['cloud_provider'], "gcp")
-        self.assertEqual(data['configuration']['gcp_project_id'], "json-test-project")
+        self.assertEqual(data['configuration']['gcp_project_id'], "test-project-456")
         self.assertEqual(data['configuration']['database_type'], "cloudsql")
         self.assertEqual(data['configuration']['cloudsql_instance_name'], "test-db")
 
@@ -423,12 +439,14 @@ class TestConfigHistoryManagerGCP(unittest.TestCase):
             }
         }
 
-        json_file = self.temp_dir / ".setup-current.json"
-        with open(json_file, 'w') as f:
-            json.dump(config_data, f)
+        with tempfile.TemporaryDirectory() as temp:
+            temp_dir = Path(temp)
+            json_file = temp_dir / ".setup-current.json"
+            with open(json_file, 'w') as f:
+                json.dump(config_data, f)
 
-        # Load configuration
-        loaded = ConfigHistoryManager.load_previous_configuration(self.temp_dir)
+            # Load configuration
+            loaded = ConfigHistoryManager.load_previous_configuration(temp_dir)
 
         self.assertIsNotNone(loaded)
         self.assertEqual(loaded['cloud_provider'], 'gcp')
@@ -458,26 +476,40 @@ class TestConfigHistoryManagerGCP(unittest.TestCase):
             config_dict
         )
 
-        # Check all GCP fields are included
-        self.assertIn("gcp_project_id", entry)
-        self.assertIn("test-project", entry)
-        self.assertIn("gcp_region", entry)
-        self.assertIn("us-central1", entry)
-        self.assertIn("gcp_zone", entry)
-        self.assertIn("us-central1-a", entry)
-        self.assertIn("vpc_name", entry)
-        self.assertIn("test-vpc", entry)
-        self.assertIn("node_machine_type", entry)
-        self.assertIn("e2-medium", entry)
-        self.assertIn("cloudsql_instance_name", entry)
-        self.assertIn("test-db", entry)
-        self.assertIn("enable_tls", entry)
-        self.assertIn("True", entry)
+        # Check all GCP fields are included, each as a "- **key**: `value`" line
+        expected = {
+            f"- **{key}**: `{value}`"
+            for key, value in (
+                ("gcp_project_id", "test-project"),
+                ("gcp_region", "us-central1"),
+                ("gcp_zone", "us-central1-a"),
+                ("vpc_name", "test-vpc"),
+                ("node_machine_type", "e2-medium"),
+                ("cloudsql_instance_name", "test-db"),
+                ("enable_tls", "True"),
+            )
+        }
+        self.assertEqual(expected - set(entry.splitlines()), set())
 
 
 class TestConfigurationPromptGCP(unittest.TestCase):
     """Test ConfigurationPrompt with GCP"""
 
+    def setUp(self):
+        """Mock user input and the gcloud checks, and silence the prompts"""
+        self._stack = contextlib.ExitStack()
+        self._stack.enter_context(contextlib.redirect_stdout(io.StringIO()))
+        self.mock_input = self._stack.enter_context(patch('builtins.input'))
+        self.mock_list_projects = self._stack.enter_context(
+            patch('setup.GCPAuthChecker.list_projects'))
+        self.mock_verify = self._stack.enter_context(
+            patch('setup.GCPAuthChecker.verify_credentials'))
+        self.mock_check_apis = self._stack.enter_context(
+            patch('setup.GCPAuthChecker.check_required_apis'))
+
+    def tearDown(self):
+        self._stack.close()
+
     def test_init_gcp_provider(self):
         """Test ConfigurationPrompt.__init__ with cloud_provider='gcp'"""
         prompt = ConfigurationPrompt(cloud_provider="gcp")
@@ -485,37 +517,17 @@ class TestConfigurationPromptGCP(unittest.TestCase):
         self.assertEqual(prompt.cloud_provider, "gcp")
         self.assertIsInstance(prompt.config, GCPDeploymentConfig)
 
-    @patch('builtins.input')
-    @patch('setup.GCPAuthChecker.list_projects')
-    @patch('setup.GCPAuthChecker.verify_credentials')
-    @patch('setup.GCPAuthChecker.check_required_apis')
-    @patch('builtins.print')
-    def test_collect_gcp_configuration_single_project(
-        self, mock_print, mock_check_apis, mock_verify, mock_list_projects, mock_input
-    ):
+    def test_collect_gcp_configuration_single_project(self):
         """Test collect_gcp_configuration with single project"""
         # Mock single project
-        mock_list_projects.return_value = [
+        self.mock_list_projects.return_value = [
             {"projectId": "solo-project", "name": "Solo Project"}
         ]
-        mock_verify.return_value = (True, "Authenticated")
-        mock_check_apis.return_value = (True, [])
+        self.mock_verify.return_value = (True, "Authenticated")
+        self.mock_check_apis.return_value = (True, [])
 
         # Mock user inputs
-        mock_input.side_effect = [
-            "",  # region (default us-central1)
-            "",  # cluster name (default)
-            "3",  # machine type choice (3 = e2-medium, which is option index 2)
-            "",  # node count (default 1)
-            "",  # vpc name
-            "",  # subnet name
-            "",  # namespace
-            "n8n-gcp.example.com",  # hostname
-            "",  # timezone
-            "y",  # generate encryption key
-            "1",  # database type (SQLite)
-            "y"   # proceed
-        ]
+        self.mock_input.side_effect = iter(_BASE_INPUTS)
 
         prompt = ConfigurationPrompt(cloud_provider="gcp")
         config = prompt.collect_gcp_configuration(skip_tls=True)
@@ -528,32 +540,21 @@ class TestConfigurationPromptGCP(unittest.TestCase):
         self.assertEqual(config.database_type, "sqlite")
         self.assertEqual(config.n8n_host, "n8n-gcp.example.com")
 
-    @patch('builtins.input')
-    @patch('setup.GCPAuthChecker.list_projects')
-    @patch('builtins.print')
-    def test_collect_gcp_configuration_no_projects(
-        self, mock_print, mock_list_projects, mock_input
-    ):
+    def test_collect_gcp_configuration_no_projects(self):
         """Test collect_gcp_configuration fails when no projects found"""
-        mock_list_projects.return_value = []
+        self.mock_list_projects.return_value = []
 
         prompt = ConfigurationPrompt(cloud_provider="gcp")
 
         with self.assertRaises(SetupInterrupted):
             prompt.collect_gcp_configuration(skip_tls=True)
 
-    @patch('builtins.input')
-    @patch('setup.GCPAuthChecker.list_projects')
-    @patch('setup.GCPAuthChecker.verify_credentials')
-    @patch('builtins.print')
-    def test_collect_gcp_configuration_auth_failure(
-        self, mock_print, mock_verify, mock_list_projects, mock_input
-    ):
+    def test_collect_gcp_configuration_auth_failure(self):
         """Test collect_gcp_configuration fails on auth failure"""
-        mock_list_projects.return_value = [
+        self.mock_list_projects.return_value = [
             {"projectId": "test-project", "name": "Test"}
         ]
-        mock_verify.return_value = (False, "Authentication failed")
+        self.mock_verify.return_value = (False, "Authentication failed")
 
         prompt = ConfigurationPrompt(cloud_provider="gcp")
 